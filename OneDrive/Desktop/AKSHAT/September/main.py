@@ -1,9 +1,52 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from septemberos.app import SeptemberOSApp
+from septemberos.singleinstance import InstanceServer, claim_instance, parse_launch_request
 
 if __name__ == "__main__":
+    if "--profile-imports" in sys.argv:
+        # Import-time tree for startup; exits non-zero if a heavy module is eager
+        from septemberos.importprofile import profile_imports
+        sys.exit(profile_imports())
+
+    # A second launch hands its options to the running instance and exits
+    # before QtWidgets or the app are even imported
+    request = parse_launch_request(sys.argv)
+    try:
+        instance_lock = claim_instance(request)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    if instance_lock is None:
+        sys.exit(0)
+
+    from PyQt5.QtWidgets import QApplication
+    from septemberos.app import SeptemberOSApp
+    from septemberos.watchdog import StallWatchdog
+
     app = QApplication(sys.argv)
+    # Logs the stack of anything that blocks the event loop for over 250 ms
+    watchdog = StallWatchdog()
+    watchdog.start()
+    app.aboutToQuit.connect(watchdog.stop)
+
+    if "--profile-memory" in sys.argv:
+        # tracemalloc snapshot every minute, attributed in memory_report.txt
+        from septemberos.memprofile import MemoryProfiler
+        profiler = MemoryProfiler()
+        profiler.start()
+        app.aboutToQuit.connect(profiler.stop)
+
     window = SeptemberOSApp()
     window.show()
+    if request:
+        window.handle_launch_request(request)
+    # Later launches retry until this listens, so none of their requests is lost
+    try:
+        instance = InstanceServer(instance_lock)
+    except OSError as e:
+        # Still holding the lock keeps a second instance away from the data files
+        print(f"Warning: {e}; later launches cannot hand over their options", file=sys.stderr)
+        app.aboutToQuit.connect(instance_lock.unlock)
+    else:
+        instance.request_received.connect(window.handle_launch_request)
+        app.aboutToQuit.connect(instance.close)
     sys.exit(app.exec_())
@@ -0,0 +1,92 @@
+import ast
+import random
+
+
+ALGORITHMS = [
+    "Bubble Sort", "Selection Sort", "Insertion Sort", "Merge Sort",
+    "Quick Sort", "Binary Search", "Linear Search", "DFS", "BFS"
+]
+
+
+def parse_algorithm_input(text):
+    """'[5, 2, 8]' or '5, 2, 8' as a list; eight random values when empty or invalid"""
+    text = text.strip()
+    if text:
+        try:
+            if text.startswith('[') and text.endswith(']'):
+                return ast.literal_eval(text)
+            return [int(x.strip()) for x in text.split(',')]
+        except (ValueError, SyntaxError):
+            pass
+    return [random.randint(1, 99) for _ in range(8)]
+
+
+def algorithm_steps(algorithm, data):
+    """Generate step-by-step visualization data for algorithms"""
+    steps = []
+
+    if algorithm == "Bubble Sort":
+        arr = data.copy()
+        steps.append({
+            'type': 'array',
+            'data': arr.copy(),
+            'description': "Initial array - Bubble Sort will compare adjacent elements"
+        })
+
+        n = len(arr)
+        for i in range(n):
+            for j in range(0, n - i - 1):
+                # Highlight comparison
+                steps.append({
+                    'type': 'array',
+                    'data': arr.copy(),
+                    'highlight': [j, j + 1],
+                    'description': f"Comparing elements at positions {j} and {j+1}: {arr[j]} vs {arr[j+1]}"
+                })
+
+                if arr[j] > arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    steps.append({
+                        'type': 'array',
+                        'data': arr.copy(),
+                        'colors': ['#90EE90' if k == j or k == j+1 else '#CD853F' for k in range(len(arr))],
+                        'description': f"Swapped {arr[j+1]} and {arr[j]} - array is now: {arr}"
+                    })
+
+    elif algorithm == "Linear Search":
+        arr = data.copy()
+        # Search for middle element
+        target = arr[len(arr)//2] if arr else 0
+
+        steps.append({
+            'type': 'array',
+            'data': arr.copy(),
+            'description': f"Linear Search: Looking for {target} in the array"
+        })
+
+        for i, val in enumerate(arr):
+            steps.append({
+                'type': 'array',
+                'data': arr.copy(),
+                'highlight': [i],
+                'description': f"Checking position {i}: {val} {'==' if val == target else '!='} {target}"
+            })
+
+            if val == target:
+                steps.append({
+                    'type': 'array',
+                    'data': arr.copy(),
+                    'colors': ['#90EE90' if k == i else '#CD853F' for k in range(len(arr))],
+                    'description': f"Found {target} at position {i}! Search complete."
+                })
+                break
+
+    else:
+        # Default case - just show the array
+        steps.append({
+            'type': 'array',
+            'data': data,
+            'description': f"{algorithm} visualization - This is a simplified demo"
+        })
+
+    return steps
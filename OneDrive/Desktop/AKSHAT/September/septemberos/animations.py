@@ -3,6 +3,8 @@ from PyQt5.QtCore import QTimer, QPropertyAnimation, QEasingCurve, QRect, pyqtPr
 from PyQt5.QtGui import QPainter, QPixmap, QColor, QFont
 import random
 import math
+from .tracing import traced
+from .metrics import measured
 
 
 class FallingLeaf(QLabel):
@@ -76,6 +78,13 @@ class FallingLeavesWidget(QWidget):
         # Randomize next leaf timing
         self.leaf_timer.start(random.randint(3000, 7000))
 
+    def suspend(self):
+        self.leaf_timer.stop()
+
+    def resume(self):
+        if not self.leaf_timer.isActive():
+            self.leaf_timer.start(random.randint(2000, 5000))
+
 
 class PulsingWidget(QWidget):
     def __init__(self, parent=None):
@@ -151,6 +160,12 @@ class FloatingParticles(QWidget):
         for _ in range(20):
             self.create_particle()
 
+    def suspend(self):
+        self.particle_timer.stop()
+
+    def resume(self):
+        self.particle_timer.start(50)
+
     def create_particle(self):
         if self.parent():
             particle = {
@@ -164,6 +179,8 @@ class FloatingParticles(QWidget):
             }
             self.particles.append(particle)
 
+    @traced()
+    @measured("animation.particles")
     def update_particles(self):
         if not self.parent():
             return
@@ -188,6 +205,8 @@ class FloatingParticles(QWidget):
 
         self.update()
 
+    @traced()
+    @measured("render.particles")
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -230,12 +249,21 @@ class WaveAnimation(QWidget):
     def stop_wave(self):
         self.wave_timer.stop()
 
+    def suspend(self):
+        self.stop_wave()
+
+    def resume(self):
+        self.start_wave()
+
+    @measured("animation.wave")
     def update_wave(self):
         self.wave_offset += 0.2
         if self.wave_offset > 2 * math.pi:
             self.wave_offset = 0
         self.update()
 
+    @traced()
+    @measured("render.wave")
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -1,26 +1,202 @@
-from PyQt5.QtWidgets import QMainWindow, QTabWidget
-from .lofiboard import LoFiBoard
-from .studynest import StudyNest
-from .equinox import Equinox
-from .septempo import SepTempo
-from .leaflet import Leaflet
-from .theme import apply_september_theme
+from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QLabel, QShortcut
+from PyQt5.QtCore import Qt, QEvent, QTimer, QDate
+from PyQt5.QtGui import QKeySequence
+from importlib import import_module
+import time
+from .theme import apply_september_theme, set_theme_animations_active
+from .persistence import flush_writes
+from .tracing import ENABLED as TRACING_ENABLED, export_chrome_trace, span
 from .music import play_lofi_music
 
 
+# Pause between idle-time tab builds so input is never blocked for long
+PREBUILD_DELAY_MS = 1500
+
+
+def module_factory(module_name, class_name):
+    """Factory that imports a tab module only when the tab is first built"""
+    def build():
+        module = import_module(f".{module_name}", __package__)
+        return getattr(module, class_name)()
+    build.__name__ = class_name
+    return build
+
+
+class LazyTab(QWidget):
+    """Tab page that constructs its module the first time it is needed"""
+
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+        self.page = None
+        self.build_seconds = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.loading_label = QLabel("🍂 Loading...")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.loading_label)
+        self.setLayout(layout)
+
+    def build(self):
+        if self.page is None:
+            started = time.perf_counter()
+            with span(f"build {self.factory.__name__}"):
+                self.page = self.factory()
+            self.build_seconds = time.perf_counter() - started
+            self.layout().removeWidget(self.loading_label)
+            self.loading_label.deleteLater()
+            self.layout().addWidget(self.page)
+        return self.page
+
+    def suspend(self):
+        if self.page is not None and hasattr(self.page, "suspend"):
+            self.page.suspend()
+
+    def resume(self):
+        page = self.build()
+        if hasattr(page, "resume"):
+            page.resume()
+
+
 class SeptemberOSApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, prebuild_tabs=True):
         super().__init__()
         self.setWindowTitle("SeptemberOS – Cozy Productivity Suite 🍂")
         self.resize(1200, 800)  # Larger size for all modules
         apply_september_theme(self)
         play_lofi_music()
 
+        # Only the tab on screen is built before the first paint; the rest are
+        # built when first opened or, with prebuild_tabs, while the app is idle
         self.tabs = QTabWidget()
-        self.tabs.addTab(LoFiBoard(), "LoFiBoard 📝")
-        self.tabs.addTab(StudyNest(), "StudyNest ⏳")
-        self.tabs.addTab(Equinox(), "Equinox 🌤️")
-        self.tabs.addTab(SepTempo(), "SepTempo 📅")
-        self.tabs.addTab(Leaflet(), "Leaflet 🌿")
+        self.tabs.addTab(LazyTab(module_factory("lofiboard", "LoFiBoard")), "LoFiBoard 📝")
+        self.tabs.addTab(LazyTab(module_factory("studynest", "StudyNest")), "StudyNest ⏳")
+        self.tabs.addTab(LazyTab(module_factory("equinox", "Equinox")), "Equinox 🌤️")
+        self.tabs.addTab(LazyTab(module_factory("septempo", "SepTempo")), "SepTempo 📅")
+        self.tabs.addTab(LazyTab(module_factory("leaflet", "Leaflet")), "Leaflet 🌿")
 
         self.setCentralWidget(self.tabs)
+        # Data files are written in the background; finish them before exiting
+        QApplication.instance().aboutToQuit.connect(flush_writes)
+        self.prebuild_tabs = prebuild_tabs
+        self.prebuild_started = False
+        self.setup_tab_lifecycle()
+
+        diagnostics = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        diagnostics.activated.connect(self.toggle_diagnostics)
+
+        if TRACING_ENABLED:
+            export = QShortcut(QKeySequence("Ctrl+Shift+T"), self)
+            export.activated.connect(lambda: print(f"Trace written to {export_chrome_trace()}"))
+
+    def toggle_diagnostics(self):
+        """Show or hide the diagnostics tab, which is not listed by default"""
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if tab.factory.__name__ == "DiagnosticsTab":
+                self.tabs.removeTab(index)
+                if tab.page is not None:
+                    tab.page.release()
+                tab.deleteLater()
+                return
+        tab = LazyTab(module_factory("diagnostics", "DiagnosticsTab"))
+        self.tabs.setCurrentIndex(self.tabs.addTab(tab, "Diagnostics 🩺"))
+
+    def tab_page(self, index):
+        """The module widget behind a tab, building it if necessary"""
+        return self.tabs.widget(index).build()
+
+    def show_module(self, class_name):
+        """Switch to the tab of a module and return its widget"""
+        for index in range(self.tabs.count()):
+            if self.tabs.widget(index).factory.__name__ == class_name:
+                self.tabs.setCurrentIndex(index)
+                return self.tab_page(index)
+        return None
+
+    def handle_launch_request(self, request):
+        """Act on the options of a launch (this one or a later one handed over by
+        the single-instance server) and bring the window to the front"""
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+        if request.get("note"):
+            if not self.show_module("LoFiBoard").open_note(request["note"]):
+                print(f"No note matches {request['note']!r}")
+        if request.get("date"):
+            date = QDate.fromString(request["date"], "yyyy-MM-dd")
+            if date.isValid():
+                self.show_module("SepTempo").jump_to_date(date)
+            else:
+                print(f"Invalid date {request['date']!r}; expected yyyy-MM-dd")
+
+    def prebuild_next_tab(self):
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if tab.page is None:
+                tab.build()
+                if tab is not self.active_tab:
+                    tab.suspend()
+                QTimer.singleShot(PREBUILD_DELAY_MS, self.prebuild_next_tab)
+                return
+
+    def setup_tab_lifecycle(self):
+        # Tabs with suspend()/resume() only run their background timers while
+        # they are the visible tab of a visible, non-minimized window
+        self.active_tab = None
+        self.watched_window = None
+        for index in range(self.tabs.count()):
+            self.suspend_tab(self.tabs.widget(index))
+        self.tabs.currentChanged.connect(self.update_tab_activity)
+        QApplication.instance().applicationStateChanged.connect(self.update_tab_activity)
+
+    def window_is_visible(self):
+        if not self.isVisible() or self.isMinimized():
+            return False
+        if QApplication.applicationState() in (Qt.ApplicationHidden, Qt.ApplicationSuspended):
+            return False
+        handle = self.windowHandle()
+        # Platforms that report occlusion unexpose fully covered windows
+        return handle is None or handle.isExposed()
+
+    def update_tab_activity(self, *args):
+        current = self.tabs.currentWidget() if self.window_is_visible() else None
+        if current is self.active_tab:
+            return
+        if self.active_tab is not None:
+            self.suspend_tab(self.active_tab)
+        self.active_tab = current
+        if current is not None and hasattr(current, "resume"):
+            current.resume()
+        set_theme_animations_active(self, current is not None)
+
+    def suspend_tab(self, tab):
+        if hasattr(tab, "suspend"):
+            tab.suspend()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and handle is not self.watched_window:
+            handle.installEventFilter(self)
+            self.watched_window = handle
+        self.update_tab_activity()
+        if self.prebuild_tabs and not self.prebuild_started:
+            self.prebuild_started = True
+            QTimer.singleShot(PREBUILD_DELAY_MS, self.prebuild_next_tab)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_tab_activity()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_tab_activity()
+
+    def eventFilter(self, watched, event):
+        if watched is self.watched_window and event.type() == QEvent.Expose:
+            self.update_tab_activity()
+        return super().eventFilter(watched, event)
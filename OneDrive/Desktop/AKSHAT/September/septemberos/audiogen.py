@@ -0,0 +1,69 @@
+import os
+import wave
+
+
+AUDIO_DIR = "audio"
+SAMPLE_RATE = 22050
+TRACK_SECONDS = 30
+
+# Ambient tracks as sequences of gentle tones (Hz)
+TRACKS = {
+    "Ambient Autumn": [220, 165, 196, 147],  # Warm, low frequencies
+    "Gentle Rain Sounds": [130, 98, 123, 110],  # Very low, rain-like
+    "Forest Whispers": [174, 196, 220, 165],  # Natural, organic feel
+    "September Breeze": [196, 220, 247, 185],  # Light, airy
+    "Cozy Afternoon": [147, 165, 130, 196],  # Comfortable, warm
+    "Productivity Flow": [185, 207, 233, 175],  # Focused, steady
+    "Focus Zone": [233, 196, 220, 185]  # Clear, concentrated
+}
+
+
+def track_filename(track_name, audio_dir=AUDIO_DIR):
+    return os.path.join(audio_dir, f"{track_name.replace(' ', '_').lower()}.wav")
+
+
+def create_tone_sequence(frequencies, duration, sample_rate):
+    """Sine tones played one after another, each faded in and out to prevent clicks"""
+    import numpy as np  # Deferred: only needed when audio is generated
+
+    samples = int(sample_rate * duration)
+    waves = []
+    for freq in frequencies:
+        t = np.linspace(0, duration / len(frequencies), samples // len(frequencies))
+        wave_data = np.sin(2 * np.pi * freq * t)
+
+        fade_samples = int(0.1 * len(wave_data))
+        wave_data[:fade_samples] *= np.linspace(0, 1, fade_samples)
+        wave_data[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+
+        # Reduce volume
+        wave_data *= 0.3
+        waves.append(wave_data)
+    return np.concatenate(waves)
+
+
+def write_track(filename, frequencies, duration=TRACK_SECONDS, sample_rate=SAMPLE_RATE):
+    """Render one track as a 16-bit stereo WAV file"""
+    import numpy as np
+
+    audio_data = (create_tone_sequence(frequencies, duration, sample_rate) * 32767).astype(np.int16)
+    stereo_data = np.ascontiguousarray(np.column_stack((audio_data, audio_data)))
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(stereo_data.tobytes())
+
+
+def generate_ambient_audio(audio_dir=AUDIO_DIR, tracks=None, duration=TRACK_SECONDS,
+                           sample_rate=SAMPLE_RATE, overwrite=True):
+    """Write the ambient tracks used by Equinox's background music; returns the files written"""
+    os.makedirs(audio_dir, exist_ok=True)
+    written = []
+    for track_name in tracks or TRACKS:
+        filename = track_filename(track_name, audio_dir)
+        if not overwrite and os.path.exists(filename):
+            continue
+        write_track(filename, TRACKS[track_name], duration, sample_rate)
+        written.append(filename)
+    return written
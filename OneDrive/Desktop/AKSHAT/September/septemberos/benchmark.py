@@ -0,0 +1,221 @@
+"""Headless startup and idle benchmark for SeptemberOS.
+
+    python -m septemberos.benchmark [--runs 3] [--idle-seconds 5] [--fail-on-regression 20]
+
+Each run launches the app in a fresh process on the offscreen Qt platform,
+inside a scratch data directory so personal data is neither read nor
+modified (pass --data-dir to benchmark against real data). Results are
+appended to a JSON history file and compared with the previous entry.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+
+RESULT_PREFIX = "BENCHMARK_RESULT "
+HISTORY_FILE = "benchmark_history.json"
+SWITCH_REPEATS = 5
+
+
+def measure_idle(counter, seconds):
+    from PyQt5.QtCore import QEventLoop, QTimer
+
+    try:
+        import resource
+        switches = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_nvcsw
+    except ImportError:
+        switches = None
+
+    counter.timer_events = 0
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    switches_start = switches() if switches else 0
+    # A nested event loop sleeps between events exactly like app.exec_() does
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+    wall = time.perf_counter() - wall_start
+    result = {
+        "cpu_percent": 100 * (time.process_time() - cpu_start) / wall,
+        "timer_events_per_s": counter.timer_events / wall,
+    }
+    if switches:
+        result["context_switches_per_s"] = (switches() - switches_start) / wall
+    return result
+
+
+def run_child(idle_seconds):
+    """Runs inside the benchmarked process and prints one JSON result line"""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QObject, QEvent
+
+    class EventCounter(QObject):
+        def __init__(self):
+            super().__init__()
+            self.first_paint = None
+            self.timer_events = 0
+
+        def eventFilter(self, watched, event):
+            kind = event.type()
+            if kind == QEvent.Timer:
+                self.timer_events += 1
+            elif kind == QEvent.Paint and self.first_paint is None:
+                self.first_paint = time.time()
+            return False
+
+    app = QApplication(sys.argv[:1])
+    qt_ready = time.time()
+    counter = EventCounter()
+    app.installEventFilter(counter)
+
+    from septemberos.app import SeptemberOSApp
+    started = time.perf_counter()
+    window = SeptemberOSApp(prebuild_tabs=False)
+    construct = time.perf_counter() - started
+    window.show()
+    while counter.first_paint is None:
+        app.processEvents()
+
+    metrics = {
+        "first_paint_at": counter.first_paint,
+        "qt_ready_at": qt_ready,
+        "window_construct_ms": construct * 1000,
+    }
+
+    def switch_to(index):
+        started = time.perf_counter()
+        window.tabs.setCurrentIndex(index)
+        window.tabs.currentWidget().repaint()
+        app.processEvents()
+        return (time.perf_counter() - started) * 1000
+
+    tabs = [window.tabs.widget(index) for index in range(window.tabs.count())]
+    names = []
+    for index, tab in enumerate(tabs):
+        # The first tab is built during show(); the others on their first switch
+        first = switch_to(index)
+        name = type(tab.page).__name__
+        names.append(name)
+        metrics[f"first_switch_ms.{name}"] = first
+        metrics[f"tab_build_ms.{name}"] = tab.build_seconds * 1000
+
+    for index, name in enumerate(names):
+        samples = []
+        for _ in range(SWITCH_REPEATS):
+            switch_to((index + 1) % len(tabs))
+            samples.append(switch_to(index))
+        metrics[f"switch_ms.{name}"] = statistics.median(samples)
+
+    window.tabs.setCurrentIndex(0)
+    for key, value in measure_idle(counter, idle_seconds).items():
+        metrics[f"idle_visible.{key}"] = value
+    window.showMinimized()
+    app.processEvents()
+    for key, value in measure_idle(counter, idle_seconds).items():
+        metrics[f"idle_minimized.{key}"] = value
+
+    print(RESULT_PREFIX + json.dumps(metrics), flush=True)
+    return 0
+
+
+def run_once(idle_seconds, data_dir):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    command = [sys.executable, "-m", "septemberos.benchmark", "--child",
+               "--idle-seconds", str(idle_seconds)]
+
+    launched = time.time()
+    result = subprocess.run(command, cwd=data_dir, env=env, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            metrics = json.loads(line[len(RESULT_PREFIX):])
+            metrics["startup_to_first_paint_ms"] = (metrics.pop("first_paint_at") - launched) * 1000
+            metrics["startup_to_qt_ready_ms"] = (metrics.pop("qt_ready_at") - launched) * 1000
+            return metrics
+    raise RuntimeError(f"Benchmark process failed ({result.returncode}):\n{result.stderr[-2000:]}")
+
+
+def load_history(path):
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return []
+
+
+def compare(current, baseline, threshold):
+    """Print a comparison table; returns metric names that regressed past threshold %"""
+    regressions = []
+    print(f"{'metric':<44} {'current':>10} {'previous':>10} {'change':>8}")
+    for key in sorted(current):
+        value = current[key]
+        previous = baseline.get(key) if baseline else None
+        if previous is None:
+            print(f"{key:<44} {value:10.2f} {'-':>10} {'':>8}")
+            continue
+        change = (value - previous) / previous * 100 if previous else 0.0
+        flag = ""
+        # Tiny absolute values (e.g. 0.3 ms) are too noisy to gate on
+        if threshold is not None and change > threshold and value - previous > 1.0:
+            regressions.append(key)
+            flag = "  <-- regression"
+        print(f"{key:<44} {value:10.2f} {previous:10.2f} {change:+7.1f}%{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark SeptemberOS startup and idle cost")
+    parser.add_argument("--runs", type=int, default=3, help="runs per benchmark; medians are kept")
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    parser.add_argument("--data-dir", help="run against this data directory instead of a scratch one")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON file results are appended to")
+    parser.add_argument("--fail-on-regression", type=float, metavar="PERCENT",
+                        help="exit with status 1 if a metric is this much worse than last time")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return run_child(args.idle_seconds)
+
+    history_path = os.path.abspath(args.history)
+    runs = []
+    for run in range(args.runs):
+        print(f"Run {run + 1}/{args.runs}...", flush=True)
+        if args.data_dir:
+            runs.append(run_once(args.idle_seconds, args.data_dir))
+        else:
+            with tempfile.TemporaryDirectory(prefix="septemberos-bench-") as data_dir:
+                runs.append(run_once(args.idle_seconds, data_dir))
+    metrics = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    history = load_history(history_path)
+    regressions = compare(metrics, history[-1]["metrics"] if history else None,
+                          args.fail_on_regression)
+    history.append({
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "idle_seconds": args.idle_seconds,
+        "metrics": metrics,
+    })
+    with open(history_path, "w") as f:
+        json.dump(history, f, indent=2)
+
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.fail_on_regression:g}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
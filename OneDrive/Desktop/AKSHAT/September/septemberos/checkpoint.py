@@ -0,0 +1,65 @@
+import os
+import struct
+import zlib
+
+
+# magic, version, phase, running, reserved, session_count, time_left, deadline, crc32
+CHECKPOINT_FORMAT = "<4sBBBxIId"
+CHECKPOINT_MAGIC = b"SNCP"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_SIZE = struct.calcsize(CHECKPOINT_FORMAT) + 4
+
+PHASES = ("work", "short_break", "long_break")
+
+
+class TimerCheckpoint:
+    """Fixed-size on-disk record of the Pomodoro timer state.
+
+    The record is rewritten in place only on state transitions, so every
+    checkpoint costs a single small write. A CRC guards against torn writes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def save(self, phase, running, session_count, time_left, deadline):
+        body = struct.pack(CHECKPOINT_FORMAT, CHECKPOINT_MAGIC, CHECKPOINT_VERSION,
+                           PHASES.index(phase), int(bool(running)),
+                           max(0, int(session_count)), max(0, int(time_left)),
+                           float(deadline or 0.0))
+        record = body + struct.pack("<I", zlib.crc32(body))
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                os.write(fd, record)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass  # Losing a checkpoint must never interrupt the timer
+
+    def load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                record = f.read(CHECKPOINT_SIZE)
+        except OSError:
+            return None
+
+        if len(record) != CHECKPOINT_SIZE:
+            return None
+        body, (crc,) = record[:-4], struct.unpack("<I", record[-4:])
+        if zlib.crc32(body) != crc:
+            return None
+
+        magic, version, phase, running, session_count, time_left, deadline = \
+            struct.unpack(CHECKPOINT_FORMAT, body)
+        if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION or phase >= len(PHASES):
+            return None
+
+        return {
+            "phase": PHASES[phase],
+            "running": bool(running),
+            "session_count": session_count,
+            "time_left": time_left,
+            "deadline": deadline,
+        }
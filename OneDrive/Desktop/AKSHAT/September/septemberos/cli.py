@@ -0,0 +1,330 @@
+"""Headless SeptemberOS commands for scripting and batch work.
+
+    python -m septemberos notes search "exam"
+    python -m septemberos calendar import holidays.ics
+    python -m septemberos moods --since 2025-09-01
+    python -m septemberos compact
+
+Commands work on the data files in the current directory, like the app
+(or in --data-dir). Only argparse is imported up front; each command
+imports the storage and engine modules it needs, so a call starts in a few
+tens of milliseconds. Only the commands that write data import PyQt's
+QtNetwork, to refuse while the app has the same files open.
+"""
+import argparse
+import json
+import os
+import sys
+
+
+JSON_DATA_FILES = ("notes_database.json", "note_categories.json", "mood_data.json",
+                   "weather_history.json", "equinox_settings.json", "timer_settings.json",
+                   "study_plans.json", "algorithm_history.json")
+
+
+def print_json(data):
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+def notes_search(args):
+    from .notes import load_notes, filter_notes
+
+    matches = filter_notes(load_notes(), args.term, args.category)
+    if args.json:
+        print_json([note for _, note in matches])
+        return 0
+    for note_id, note in matches:
+        print(f"{note_id}\t{note.get('created', '')[:16]}\t{note.get('category', 'General')}\t"
+              f"{note.get('title', 'Untitled Note')}")
+    return 0 if matches else 1
+
+
+def notes_export(args):
+    from .notes import load_notes, filter_notes
+
+    notes = dict(filter_notes(load_notes(), category=args.category))
+    if args.markdown:
+        os.makedirs(args.path, exist_ok=True)
+        for note_id, note in notes.items():
+            with open(os.path.join(args.path, f"{note_id}.md"), "w", encoding="utf-8") as f:
+                f.write(f"# {note.get('title', 'Untitled Note')}\n\n{note.get('content', '')}\n")
+    else:
+        with open(args.path, "w", encoding="utf-8") as f:
+            json.dump(notes, f, indent=2, ensure_ascii=False)
+    print(f"Exported {len(notes)} notes to {args.path}")
+    return 0
+
+
+def note_from_text(path, category):
+    from datetime import datetime
+
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    title = os.path.splitext(os.path.basename(path))[0]
+    first_line, _, rest = content.partition("\n")
+    if first_line.startswith("# "):
+        title, content = first_line[2:].strip(), rest.lstrip("\n")
+    modified = datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d %H:%M:%S')
+    return {'title': title, 'content': content.rstrip("\n"), 'category': category,
+            'created': modified, 'modified': modified}
+
+
+def ensure_app_not_running():
+    """The app rewrites its data files from memory, so a write made while it
+    runs would be lost or would clobber the app's own changes"""
+    try:
+        from .singleinstance import instance_name, instance_running
+    except ImportError:
+        return  # Without PyQt5 this interpreter cannot be running the app either
+    if instance_running(instance_name()):
+        raise OSError("SeptemberOS is running on these data files; close it and try again")
+
+
+def notes_import(args):
+    import time
+    from .notes import NOTES_FILE, load_notes
+    from .persistence import save_json, flush_writes
+
+    ensure_app_not_running()
+    notes = load_notes()
+    imported = 0
+    next_id = int(time.time())
+    for path in args.paths:
+        if path.endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                incoming = json.load(f)
+            if not isinstance(incoming, dict):
+                raise ValueError(f"{path} does not hold notes keyed by id")
+        else:
+            incoming = {None: note_from_text(path, args.category)}
+        for note_id, note in incoming.items():
+            if note_id is None or (note_id in notes and not args.replace):
+                # Same id scheme as LoFiBoard.create_new_note
+                while str(next_id) in notes:
+                    next_id += 1
+                note_id = str(next_id)
+            note.update(id=note_id)
+            note.setdefault('category', args.category)
+            notes[note_id] = note
+            imported += 1
+    save_json(NOTES_FILE, notes, indent=2, ensure_ascii=False)
+    flush_writes()
+    print(f"Imported {imported} notes")
+    return 0
+
+
+def open_store():
+    from .eventstore import EventStore
+    return EventStore()
+
+
+def calendar_import(args):
+    from .ics import import_ics
+
+    ensure_app_not_running()
+    store = open_store()
+    try:
+        count = import_ics(store, args.path)
+    finally:
+        store.close()
+    print(f"Imported {count} events from {args.path}")
+    return 0
+
+
+def calendar_export(args):
+    from .ics import export_ics
+
+    store = open_store()
+    try:
+        count = export_ics(store, args.path)
+    finally:
+        store.close()
+    print(f"Exported {count} events to {args.path}")
+    return 0
+
+
+def calendar_search(args):
+    if not any(os.path.exists(path) for path in ("calendar_events.db", "calendar_events.json")):
+        results = []  # Searching must not create an empty calendar
+    else:
+        store = open_store()
+        try:
+            results = store.search(args.text, limit=args.limit)
+        finally:
+            store.close()
+    if args.json:
+        print_json(results)
+        return 0
+    for event in results:
+        repeat = " (repeats)" if event.get("series_id") else ""
+        print(f"{event['date']} {event['time']}\t{event['category']}\t{event['title']}{repeat}")
+    return 0 if results else 1
+
+
+def moods(args):
+    from .moods import MOOD_FILE, mood_statistics
+    from .persistence import load_json
+
+    history = load_json(MOOD_FILE) if os.path.exists(MOOD_FILE) else {}
+    stats = mood_statistics(history, args.since)
+    if args.json:
+        print_json(stats)
+        return 0
+    if not stats['entries']:
+        print("No mood data available yet.")
+        return 1
+    print(f"Entries: {stats['entries']} ({stats['first']} to {stats['last']})")
+    print(f"Average intensity: {stats['average_intensity']:.1f}/10")
+    for title, key in (("Moods", 'moods'), ("Weather", 'weather'), ("Weekdays", 'weekdays')):
+        if stats[key]:
+            print(f"{title}:")
+            for name, count in stats[key].most_common():
+                print(f"  {count:4d}  {name}")
+    return 0
+
+
+def file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def compact(args):
+    from .persistence import SNAPSHOT_SUFFIX, rebuild_snapshot
+    from .eventstore import EventStore
+
+    ensure_app_not_running()
+    before = after = 0
+    for path in JSON_DATA_FILES:
+        snapshot = path + SNAPSHOT_SUFFIX
+        before += file_size(path) + file_size(snapshot) + file_size(path + ".tmp")
+        if os.path.exists(path + ".tmp"):
+            os.remove(path + ".tmp")  # Left behind by a write that never finished
+        if os.path.exists(snapshot):
+            if not os.path.exists(path):
+                os.remove(snapshot)
+            else:
+                try:
+                    rebuild_snapshot(path)  # Also drops strings a stale snapshot still held
+                except ValueError as e:
+                    print(f"Skipping {path}: {e}")
+        after += file_size(path) + file_size(snapshot)
+
+    database = "calendar_events.db"
+    if os.path.exists(database):
+        files = (database, database + "-wal", database + "-shm")
+        before += sum(file_size(path) for path in files)
+        store = EventStore(database, legacy_json=None)
+        try:
+            store.compact()
+        finally:
+            store.close()
+        after += sum(file_size(path) for path in files)
+    print(f"Data files: {before / 1024:.0f} KiB -> {after / 1024:.0f} KiB")
+    return 0
+
+
+def audio(args):
+    from .audiogen import TRACKS, generate_ambient_audio
+
+    unknown = [name for name in args.tracks if name not in TRACKS]
+    if unknown:
+        print(f"Unknown tracks: {', '.join(unknown)}; choose from {', '.join(TRACKS)}")
+        return 2
+    try:
+        written = generate_ambient_audio(args.out, args.tracks or None, args.seconds,
+                                         overwrite=not args.missing_only)
+    except ImportError as e:
+        print(f"Missing required package: {e.name} (pip install numpy)", file=sys.stderr)
+        return 1
+    for filename in written:
+        print(f"Created {filename}")
+    return 0
+
+
+def algorithm(args):
+    from .algorithms import ALGORITHMS, algorithm_steps, parse_algorithm_input
+
+    if args.name not in ALGORITHMS:
+        print(f"Unknown algorithm {args.name!r}; choose from {', '.join(ALGORITHMS)}")
+        return 2
+    steps = algorithm_steps(args.name, parse_algorithm_input(args.data))
+    if args.json:
+        print_json(steps)
+        return 0
+    for number, step in enumerate(steps, 1):
+        print(f"{number:3d}. {step['data']}  {step['description']}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m septemberos",
+                                     description="SeptemberOS data tools (no GUI)")
+    parser.add_argument("--data-dir", help="directory with the data files (default: current)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    notes = commands.add_parser("notes", help="search, export or import LoFiBoard notes")
+    notes_commands = notes.add_subparsers(dest="notes_command", required=True)
+    search = notes_commands.add_parser("search", help="notes whose title or text contains TERM")
+    search.add_argument("term")
+    search.add_argument("--category")
+    search.add_argument("--json", action="store_true")
+    search.set_defaults(handler=notes_search)
+    export = notes_commands.add_parser("export", help="write notes to a JSON file")
+    export.add_argument("path")
+    export.add_argument("--category")
+    export.add_argument("--markdown", action="store_true",
+                        help="write one .md file per note into the directory PATH")
+    export.set_defaults(handler=notes_export)
+    import_ = notes_commands.add_parser("import", help="add notes from JSON exports or text files")
+    import_.add_argument("paths", nargs="+", metavar="path")
+    import_.add_argument("--category", default="General")
+    import_.add_argument("--replace", action="store_true",
+                         help="overwrite notes with the same id instead of adding copies")
+    import_.set_defaults(handler=notes_import)
+
+    calendar = commands.add_parser("calendar", help="import, export or search SepTempo events")
+    calendar_commands = calendar.add_subparsers(dest="calendar_command", required=True)
+    import_ = calendar_commands.add_parser("import", help="import an .ics file")
+    import_.add_argument("path")
+    import_.set_defaults(handler=calendar_import)
+    export = calendar_commands.add_parser("export", help="export the calendar as .ics")
+    export.add_argument("path")
+    export.set_defaults(handler=calendar_export)
+    search = calendar_commands.add_parser("search", help="events matching every word of TEXT")
+    search.add_argument("text")
+    search.add_argument("--limit", type=int, default=200)
+    search.add_argument("--json", action="store_true")
+    search.set_defaults(handler=calendar_search)
+
+    mood = commands.add_parser("moods", help="Equinox mood statistics")
+    mood.add_argument("--since", metavar="YYYY-MM-DD")
+    mood.add_argument("--json", action="store_true")
+    mood.set_defaults(handler=moods)
+
+    compact_ = commands.add_parser("compact", help="refresh load snapshots and vacuum the calendar")
+    compact_.set_defaults(handler=compact)
+
+    audio_ = commands.add_parser("audio", help="generate the ambient music tracks (needs numpy)")
+    audio_.add_argument("tracks", nargs="*", metavar="track")
+    audio_.add_argument("--out", default="audio")
+    audio_.add_argument("--seconds", type=float, default=30)
+    audio_.add_argument("--missing-only", action="store_true")
+    audio_.set_defaults(handler=audio)
+
+    algo = commands.add_parser("algorithm", help="print Leaflet's visualization steps")
+    algo.add_argument("name")
+    algo.add_argument("data", nargs="?", default="", help="e.g. '5, 2, 8, 1' (random if omitted)")
+    algo.add_argument("--json", action="store_true")
+    algo.set_defaults(handler=algorithm)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.data_dir:
+        os.chdir(args.data_dir)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"septemberos {args.command}: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,128 @@
+import time
+import tracemalloc
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QApplication)
+from PyQt5.QtCore import Qt, QTimer, QObject, QEvent
+from PyQt5.QtGui import QFont
+
+from .metrics import registry, counter
+from .memprofile import memory_by_module
+
+
+REFRESH_MS = 1000
+# tracemalloc snapshots are slower than the metrics, so take one every few refreshes
+MEMORY_EVERY = 5
+
+
+class TimerEventCounter(QObject):
+    """App-wide event filter counting timer wakeups; only installed while visible"""
+
+    def __init__(self):
+        super().__init__()
+        self.wakeups = counter("qt.timer_events")
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Timer:
+            self.wakeups.inc()
+        return False
+
+
+class DiagnosticsTab(QWidget):
+    """Live view of the metrics registry and memory per module.
+
+    Opened with Ctrl+Shift+D. tracemalloc runs only while this tab exists,
+    so memory is attributed from the moment it was first opened.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.previous = {}
+        self.previous_time = time.monotonic()
+        self.started_tracing = False
+        self.refresh_count = 0
+        self.timer_counter = TimerEventCounter()
+
+        layout = QVBoxLayout()
+        title = QLabel("🩺 Diagnostics")
+        title.setFont(QFont("Arial", 16, QFont.Bold))
+        layout.addWidget(title)
+
+        self.metrics_table = QTableWidget(0, 7)
+        self.metrics_table.setHorizontalHeaderLabels(
+            ["Metric", "Count", "Rate /s", "p50 ms", "p90 ms", "p99 ms", "Max ms"])
+        self.metrics_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.metrics_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.metrics_table, 3)
+
+        self.memory_label = QLabel()
+        layout.addWidget(self.memory_label)
+        self.memory_table = QTableWidget(0, 2)
+        self.memory_table.setHorizontalHeaderLabels(["Module", "Traced KiB"])
+        self.memory_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.memory_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.memory_table, 2)
+        self.setLayout(layout)
+
+        self.refresh_timer = QTimer()
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def suspend(self):
+        self.refresh_timer.stop()
+        QApplication.instance().removeEventFilter(self.timer_counter)
+
+    def resume(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        QApplication.instance().installEventFilter(self.timer_counter)
+        self.refresh()
+        self.refresh_timer.start(REFRESH_MS)
+
+    def release(self):
+        """Called when the tab is closed again"""
+        self.suspend()
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def refresh(self):
+        now = time.monotonic()
+        elapsed = max(now - self.previous_time, 1e-6)
+        rows = []
+        for name, item in sorted(registry.counters.items()):
+            rate = (item.count - self.previous.get(name, item.count)) / elapsed
+            rows.append((name, item.count, rate, None))
+            self.previous[name] = item.count
+        for name, item in sorted(registry.histograms.items()):
+            rate = (item.count - self.previous.get(name, item.count)) / elapsed
+            rows.append((name, item.count, rate, item))
+            self.previous[name] = item.count
+        self.previous_time = now
+
+        self.metrics_table.setRowCount(len(rows))
+        for row, (name, count, rate, histogram) in enumerate(rows):
+            values = [name, str(count), f"{rate:.1f}"]
+            if histogram is not None:
+                values += [f"{histogram.percentile(p) / 1000:.2f}" for p in (50, 90, 99)]
+                values.append(f"{histogram.max / 1000:.2f}")
+            else:
+                values += [""] * 4
+            for column, value in enumerate(values):
+                cell = QTableWidgetItem(value)
+                if column:
+                    cell.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.metrics_table.setItem(row, column, cell)
+
+        self.refresh_count += 1
+        if tracemalloc.is_tracing() and self.refresh_count % MEMORY_EVERY == 1:
+            current, peak = tracemalloc.get_traced_memory()
+            self.memory_label.setText(
+                f"Traced memory: {current / 1024 / 1024:.1f} MiB (peak {peak / 1024 / 1024:.1f} MiB)")
+            modules = memory_by_module(tracemalloc.take_snapshot())[:12]
+            self.memory_table.setRowCount(len(modules))
+            for row, (module, size) in enumerate(modules):
+                self.memory_table.setItem(row, 0, QTableWidgetItem(module))
+                cell = QTableWidgetItem(f"{size / 1024:.0f}")
+                cell.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.memory_table.setItem(row, 1, cell)
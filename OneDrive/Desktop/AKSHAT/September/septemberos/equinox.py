@@ -1,6 +1,5 @@
 import json
 import os
-import requests
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                              QTextEdit, QSlider, QComboBox, QGroupBox, QGridLayout,
                              QProgressBar, QListWidget, QGraphicsDropShadowEffect,
@@ -15,13 +14,13 @@ import math
 import time
 from datetime import datetime, timedelta
 
-# Music functionality
-try:
-    import pygame
-    MUSIC_AVAILABLE = True
-except ImportError:
-    MUSIC_AVAILABLE = False
-    print("Pygame not available. Music functionality disabled.")
+from .music import load_pygame
+from .persistence import load_json, save_json
+from .moods import MOOD_FILE, mood_statistics
+from .tracing import traced
+from .metrics import measured
+
+WEATHER_REFRESH_MS = 300000
 
 class WeatherThread(QThread):
     weather_updated = pyqtSignal(dict)
@@ -30,6 +29,7 @@ class WeatherThread(QThread):
         super().__init__()
         self.city = city
         
+    @measured("weather.fetch")
     def run(self):
         # Enhanced weather data simulation with more details
         conditions = ["Sunny", "Cloudy", "Rainy", "Partly Cloudy", "Foggy", "Windy", "Overcast"]
@@ -69,12 +69,23 @@ class AnimatedWeatherWidget(QLabel):
         self.animation_timer.timeout.connect(self.animate_weather)
         self.animation_phase = 0
         self.weather_condition = "Sunny"
+        self.suspended = False
         
     def set_weather_condition(self, condition):
         self.weather_condition = condition
         self.start_animation()
         
+    def suspend(self):
+        self.suspended = True
+        self.animation_timer.stop()
+        
+    def resume(self):
+        self.suspended = False
+        self.start_animation()
+        
     def start_animation(self):
+        if self.suspended:
+            return
         if self.weather_condition in ["Rainy", "Foggy"]:
             self.animation_timer.start(200)  # Fast animation for rain/fog
         elif self.weather_condition in ["Windy"]:
@@ -191,10 +202,12 @@ class BackgroundMusic:
             "Focus Zone": "audio/focus_zone.wav"
         }
         
-        if MUSIC_AVAILABLE:
+        # Music functionality; pygame is only imported once the tab is built
+        self.pygame = load_pygame()
+        if self.pygame is not None:
             try:
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-                pygame.mixer.music.set_volume(self.volume)
+                self.pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                self.pygame.mixer.music.set_volume(self.volume)
                 self.available = True
                 print("🎵 Background music system initialized")
             except Exception as e:
@@ -221,11 +234,11 @@ class BackgroundMusic:
         
         try:
             # Stop any current music
-            pygame.mixer.music.stop()
+            self.pygame.mixer.music.stop()
             
             # Load and play the new track
-            pygame.mixer.music.load(audio_file)
-            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
+            self.pygame.mixer.music.load(audio_file)
+            self.pygame.mixer.music.play(-1)  # -1 means loop indefinitely
             
             self.current_track = track_name
             self.is_playing = True
@@ -242,7 +255,7 @@ class BackgroundMusic:
         """Pause current track"""
         if self.available and self.is_playing and not self.paused:
             try:
-                pygame.mixer.music.pause()
+                self.pygame.mixer.music.pause()
                 self.paused = True
                 print("⏸️ Music paused")
             except Exception as e:
@@ -252,7 +265,7 @@ class BackgroundMusic:
         """Resume current track"""
         if self.available and self.is_playing and self.paused:
             try:
-                pygame.mixer.music.unpause()
+                self.pygame.mixer.music.unpause()
                 self.paused = False
                 print(f"▶️ Resumed: {self.current_track}")
             except Exception as e:
@@ -262,7 +275,7 @@ class BackgroundMusic:
         """Stop current track"""
         if self.available:
             try:
-                pygame.mixer.music.stop()
+                self.pygame.mixer.music.stop()
                 self.is_playing = False
                 self.paused = False
                 self.current_track = None
@@ -275,7 +288,7 @@ class BackgroundMusic:
         self.volume = max(0.0, min(1.0, volume))
         if self.available:
             try:
-                pygame.mixer.music.set_volume(self.volume)
+                self.pygame.mixer.music.set_volume(self.volume)
                 print(f"🔊 Volume set to {int(self.volume * 100)}%")
             except Exception as e:
                 print(f"Error setting volume: {e}")
@@ -285,7 +298,7 @@ class BackgroundMusic:
         # Check if music is actually playing
         if self.available and self.is_playing:
             try:
-                playing = pygame.mixer.music.get_busy()
+                playing = self.pygame.mixer.music.get_busy()
                 if not playing and not self.paused:
                     # Music finished, restart it
                     if self.current_track:
@@ -304,7 +317,7 @@ class BackgroundMusic:
 class Equinox(QWidget):
     def __init__(self):
         super().__init__()
-        self.mood_file = "mood_data.json"
+        self.mood_file = MOOD_FILE
         self.weather_file = "weather_history.json"
         self.settings_file = "equinox_settings.json"
         
@@ -312,6 +325,7 @@ class Equinox(QWidget):
         self.weather_history = self.load_weather_history()
         self.settings = self.load_settings()
         self.current_weather = {}
+        self.last_weather_refresh = None
         
         self.mood_analyzer = MoodAnalyzer()
         self.background_music = BackgroundMusic()
@@ -322,28 +336,24 @@ class Equinox(QWidget):
     def load_mood_data(self):
         if os.path.exists(self.mood_file):
             try:
-                with open(self.mood_file, 'r') as f:
-                    return json.load(f)
+                return load_json(self.mood_file)
             except:
                 return {}
         return {}
     
     def save_mood_data(self):
-        with open(self.mood_file, 'w') as f:
-            json.dump(self.mood_history, f, indent=2)
+        save_json(self.mood_file, self.mood_history, indent=2)
             
     def load_weather_history(self):
         if os.path.exists(self.weather_file):
             try:
-                with open(self.weather_file, 'r') as f:
-                    return json.load(f)
+                return load_json(self.weather_file)
             except:
                 return {}
         return {}
     
     def save_weather_history(self):
-        with open(self.weather_file, 'w') as f:
-            json.dump(self.weather_history, f, indent=2)
+        save_json(self.weather_file, self.weather_history, indent=2)
             
     def load_settings(self):
         default_settings = {
@@ -363,8 +373,7 @@ class Equinox(QWidget):
         return default_settings
     
     def save_settings(self):
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        save_json(self.settings_file, self.settings, indent=2)
             
     def setup_ui(self):
         main_layout = QVBoxLayout()
@@ -1620,17 +1629,10 @@ class Equinox(QWidget):
         if not self.mood_history:
             return
             
-        total_entries = len(self.mood_history)
-        moods = [data.get('mood', '') for data in self.mood_history.values()]
-        intensities = [data.get('intensity', 5) for data in self.mood_history.values()]
-        
-        # Calculate average mood intensity
-        avg_intensity = sum(intensities) / len(intensities) if intensities else 0
-        
-        # Find most common mood
-        from collections import Counter
-        mood_counts = Counter(moods)
-        most_common = mood_counts.most_common(1)[0][0] if mood_counts else "None"
+        stats = mood_statistics(self.mood_history)
+        total_entries = stats['entries']
+        avg_intensity = stats['average_intensity']
+        most_common = stats['most_common']
         
         # Calculate streak (simplified)
         streak = min(total_entries, 7)  # Simplified calculation
@@ -2230,6 +2232,12 @@ class Equinox(QWidget):
         self.button_effects_timer.timeout.connect(self.animate_button_effects)
         self.button_effects_timer.start(1500)  # Subtle button animations
         
+        self.animation_timers = [
+            self.color_animation_timer, self.mood_pulse_timer,
+            self.weather_animation_timer, self.tab_animation_timer,
+            self.particles_timer, self.button_effects_timer,
+        ]
+        
         # Initialize particle system
         self.particles = []
         self.initialize_particle_system()
@@ -2417,6 +2425,7 @@ class Equinox(QWidget):
             }
             self.particles.append(particle)
     
+    @measured("animation.equinox_particles")
     def animate_floating_particles(self):
         """Animate floating particles across the interface"""
         for particle in self.particles[:]:  # Use slice to avoid modification during iteration
@@ -2688,14 +2697,42 @@ class Equinox(QWidget):
     def setup_weather_timer(self):
         self.weather_timer = QTimer()
         self.weather_timer.timeout.connect(self.refresh_weather)
-        self.weather_timer.start(300000)  # Refresh every 5 minutes
+        self.weather_timer.start(WEATHER_REFRESH_MS)  # Refresh every 5 minutes
         self.refresh_weather()  # Initial load
         
+    def suspend(self):
+        """Called by the main window while this tab is hidden or minimized"""
+        for timer in self.animation_timers + [self.weather_timer]:
+            timer.stop()
+        self.animated_weather_icon.suspend()
+        if self.music_icon_animation.state() == QPropertyAnimation.Running:
+            self.music_icon_animation.pause()
+        
+    def resume(self):
+        for timer in self.animation_timers:
+            timer.start()
+        self.animated_weather_icon.resume()
+        if self.music_icon_animation.state() == QPropertyAnimation.Paused:
+            self.music_icon_animation.resume()
+        
+        # Catch up on a refresh missed while hidden, otherwise wait out the rest
+        elapsed = (time.monotonic() - self.last_weather_refresh) * 1000
+        if elapsed >= WEATHER_REFRESH_MS:
+            self.refresh_weather()
+            self.weather_timer.start(WEATHER_REFRESH_MS)
+        else:
+            self.weather_timer.start(int(WEATHER_REFRESH_MS - elapsed))
+        
     def refresh_weather(self):
+        self.last_weather_refresh = time.monotonic()
+        # A refresh restarts the regular period (also after a shortened catch-up wait)
+        if self.weather_timer.isActive():
+            self.weather_timer.start(WEATHER_REFRESH_MS)
         self.weather_thread = WeatherThread(self.settings.get("city", "New York"))
         self.weather_thread.weather_updated.connect(self.update_weather_display)
         self.weather_thread.start()
         
+    @traced()
     def update_weather_display(self, weather_data):
         self.current_weather = weather_data
         
@@ -0,0 +1,577 @@
+import calendar
+import json
+import re
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from .recurrence import RecurrenceRule, OccurrenceCache
+from .intervals import IntervalTree
+from .planner import DEFAULT_EVENT_MINUTES
+
+
+EVENT_FIELDS = ("title", "time", "category", "description", "created", "remind_minutes",
+                "duration")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL DEFAULT '00:00',
+    title TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    created TEXT NOT NULL DEFAULT '',
+    remind_minutes INTEGER,
+    duration INTEGER NOT NULL DEFAULT 60
+);
+CREATE INDEX IF NOT EXISTS idx_events_date_time ON events (date, time);
+
+CREATE TABLE IF NOT EXISTS stickers (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    sticker TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_stickers_date ON stickers (date);
+
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    start_date TEXT NOT NULL,
+    last_date TEXT,
+    time TEXT NOT NULL DEFAULT '00:00',
+    title TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    created TEXT NOT NULL DEFAULT '',
+    remind_minutes INTEGER,
+    duration INTEGER NOT NULL DEFAULT 60,
+    rule TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_series_span ON series (start_date, last_date);
+"""
+
+WEEKDAY_SQL = "(CAST(strftime('%w', {row}.date) AS INTEGER) + 6) % 7"
+HOUR_SQL = "CAST(substr({row}.time, 1, 2) AS INTEGER)"
+
+HABIT_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS category_slots (
+    category TEXT NOT NULL,
+    weekday INTEGER NOT NULL,
+    hour INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (weekday, hour, category)
+);
+
+CREATE TABLE IF NOT EXISTS title_weekdays (
+    title TEXT NOT NULL,
+    weekday INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    last_date TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (title, weekday)
+);
+CREATE INDEX IF NOT EXISTS idx_title_weekdays_count ON title_weekdays (count);
+
+CREATE TRIGGER IF NOT EXISTS habits_event_insert AFTER INSERT ON events BEGIN
+    INSERT INTO category_slots (category, weekday, hour, count)
+    VALUES (NEW.category, {WEEKDAY_SQL.format(row='NEW')}, {HOUR_SQL.format(row='NEW')}, 1)
+    ON CONFLICT (weekday, hour, category) DO UPDATE SET count = count + 1;
+    INSERT INTO title_weekdays (title, weekday, count, last_date)
+    VALUES (NEW.title, {WEEKDAY_SQL.format(row='NEW')}, 1, NEW.date)
+    ON CONFLICT (title, weekday) DO UPDATE SET count = count + 1,
+        last_date = max(last_date, excluded.last_date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS habits_event_delete AFTER DELETE ON events BEGIN
+    UPDATE category_slots SET count = count - 1
+    WHERE category = OLD.category AND weekday = {WEEKDAY_SQL.format(row='OLD')}
+        AND hour = {HOUR_SQL.format(row='OLD')};
+    UPDATE title_weekdays SET count = count - 1
+    WHERE title = OLD.title AND weekday = {WEEKDAY_SQL.format(row='OLD')};
+END;
+
+CREATE TRIGGER IF NOT EXISTS habits_event_update
+AFTER UPDATE OF date, time, title, category ON events BEGIN
+    UPDATE category_slots SET count = count - 1
+    WHERE category = OLD.category AND weekday = {WEEKDAY_SQL.format(row='OLD')}
+        AND hour = {HOUR_SQL.format(row='OLD')};
+    UPDATE title_weekdays SET count = count - 1
+    WHERE title = OLD.title AND weekday = {WEEKDAY_SQL.format(row='OLD')};
+    INSERT INTO category_slots (category, weekday, hour, count)
+    VALUES (NEW.category, {WEEKDAY_SQL.format(row='NEW')}, {HOUR_SQL.format(row='NEW')}, 1)
+    ON CONFLICT (weekday, hour, category) DO UPDATE SET count = count + 1;
+    INSERT INTO title_weekdays (title, weekday, count, last_date)
+    VALUES (NEW.title, {WEEKDAY_SQL.format(row='NEW')}, 1, NEW.date)
+    ON CONFLICT (title, weekday) DO UPDATE SET count = count + 1,
+        last_date = max(last_date, excluded.last_date);
+END;
+"""
+
+# Per-day event/sticker counts kept current by triggers, for the year heatmap
+DAY_COUNTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS day_counts (
+    date TEXT PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0,
+    stickers INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS day_counts_event_insert AFTER INSERT ON events BEGIN
+    INSERT INTO day_counts (date, events) VALUES (NEW.date, 1)
+    ON CONFLICT (date) DO UPDATE SET events = events + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS day_counts_event_delete AFTER DELETE ON events BEGIN
+    UPDATE day_counts SET events = events - 1 WHERE date = OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS day_counts_event_move AFTER UPDATE OF date ON events
+WHEN OLD.date != NEW.date BEGIN
+    UPDATE day_counts SET events = events - 1 WHERE date = OLD.date;
+    INSERT INTO day_counts (date, events) VALUES (NEW.date, 1)
+    ON CONFLICT (date) DO UPDATE SET events = events + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS day_counts_sticker_insert AFTER INSERT ON stickers BEGIN
+    INSERT INTO day_counts (date, stickers) VALUES (NEW.date, 1)
+    ON CONFLICT (date) DO UPDATE SET stickers = stickers + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS day_counts_sticker_delete AFTER DELETE ON stickers BEGIN
+    UPDATE day_counts SET stickers = stickers - 1 WHERE date = OLD.date;
+END;
+"""
+
+
+def month_range(year, month):
+    """First and last yyyy-MM-dd keys of a month"""
+    last_day = calendar.monthrange(year, month)[1]
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last_day:02d}"
+
+
+class EventStore:
+    """SQLite-backed SepTempo calendar indexed by (date, time).
+
+    Dates are stored as yyyy-MM-dd strings, so lexical order is date order and
+    month/range queries are index range scans. Every insert or update is its own
+    small transaction instead of a rewrite of the whole calendar.
+    """
+
+    def __init__(self, path="calendar_events.db", legacy_json="calendar_events.json"):
+        self.path = path
+        is_new = not os.path.exists(path)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._ensure_column("events", "remind_minutes", "INTEGER")
+        self._ensure_column("series", "remind_minutes", "INTEGER")
+        self._ensure_column("events", "duration", "INTEGER NOT NULL DEFAULT 60")
+        self._ensure_column("series", "duration", "INTEGER NOT NULL DEFAULT 60")
+        self._ensure_day_counts()
+        self.has_fts = self._ensure_search_index()
+        self._ensure_habit_tables()
+        self.tree_cache = {}  # (start_key, end_key) -> IntervalTree
+        self.occurrence_cache = OccurrenceCache()
+        self.rules = {}  # series id -> (version, RecurrenceRule)
+        if is_new and legacy_json and os.path.exists(legacy_json):
+            self.import_legacy_json(legacy_json)
+
+    def close(self):
+        self.conn.close()
+
+    def compact(self):
+        """Merge the search index segments, rebuild the file without free pages
+        and fold the write-ahead log back into it"""
+        if self.has_fts:
+            with self.conn:
+                self.conn.execute("INSERT INTO events_fts (events_fts) VALUES ('optimize')")
+                self.conn.execute("INSERT INTO series_fts (series_fts) VALUES ('optimize')")
+        self.conn.execute("VACUUM")
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _ensure_column(self, table, column, declaration):
+        # Databases created by older versions lack newer columns
+        columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            with self.conn:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+    def _ensure_day_counts(self):
+        has_table = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'day_counts'").fetchone()
+        self.conn.executescript(DAY_COUNTS_SCHEMA)
+        if not has_table:
+            # Backfill once for databases created before the counts existed
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO day_counts (date, events, stickers) "
+                    "SELECT date, SUM(is_event), SUM(1 - is_event) FROM ("
+                    "SELECT date, 1 AS is_event FROM events "
+                    "UNION ALL SELECT date, 0 FROM stickers) GROUP BY date")
+
+    def _ensure_search_index(self):
+        # Full-text indexes over events and series, kept in sync by triggers
+        statements = []
+        for table in ("events", "series"):
+            statements.append(f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(
+    title, description, category, content='{table}', content_rowid='id');
+
+CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN
+    INSERT INTO {table}_fts (rowid, title, description, category)
+    VALUES (NEW.id, NEW.title, NEW.description, NEW.category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN
+    INSERT INTO {table}_fts ({table}_fts, rowid, title, description, category)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_fts_update
+AFTER UPDATE OF title, description, category ON {table} BEGIN
+    INSERT INTO {table}_fts ({table}_fts, rowid, title, description, category)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.category);
+    INSERT INTO {table}_fts (rowid, title, description, category)
+    VALUES (NEW.id, NEW.title, NEW.description, NEW.category);
+END;
+""")
+        has_index = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'events_fts'").fetchone()
+        try:
+            self.conn.executescript("".join(statements))
+        except sqlite3.OperationalError:
+            return False  # SQLite built without FTS5; search falls back to LIKE
+        if not has_index:
+            with self.conn:
+                self.conn.execute("INSERT INTO events_fts (events_fts) VALUES ('rebuild')")
+                self.conn.execute("INSERT INTO series_fts (series_fts) VALUES ('rebuild')")
+        return True
+
+    def _ensure_habit_tables(self):
+        # Frequency tables for smart suggestions, updated per inserted/deleted event.
+        # Weekdays use Python's convention (Monday = 0).
+        has_tables = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'category_slots'").fetchone()
+        self.conn.executescript(HABIT_SCHEMA)
+        if not has_tables:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO category_slots (category, weekday, hour, count) "
+                    f"SELECT category, {WEEKDAY_SQL.format(row='events')}, "
+                    f"{HOUR_SQL.format(row='events')}, COUNT(*) FROM events "
+                    "GROUP BY 1, 2, 3")
+                self.conn.execute(
+                    "INSERT INTO title_weekdays (title, weekday, count, last_date) "
+                    f"SELECT title, {WEEKDAY_SQL.format(row='events')}, COUNT(*), MAX(date) "
+                    "FROM events GROUP BY 1, 2")
+
+    def import_legacy_json(self, json_path):
+        try:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        with self.conn:
+            for date_key, day in data.items():
+                for event in day.get("events", []):
+                    self._insert_event(date_key, event)
+                self.conn.executemany(
+                    "INSERT INTO stickers (date, sticker) VALUES (?, ?)",
+                    [(date_key, sticker) for sticker in day.get("stickers", [])])
+
+    def _insert_event(self, date_key, event):
+        cursor = self.conn.execute(
+            "INSERT INTO events (date, time, title, category, description, created, "
+            "remind_minutes, duration) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (date_key, event.get("time", "00:00"), event.get("title", ""),
+             event.get("category", ""), event.get("description", ""),
+             event.get("created") or datetime.now().isoformat(),
+             event.get("remind_minutes"), event.get("duration") or DEFAULT_EVENT_MINUTES))
+        self._invalidate_trees(date_key)
+        return cursor.lastrowid
+
+    def add_event(self, date_key, event):
+        with self.conn:
+            return self._insert_event(date_key, event)
+
+    def update_event(self, event_id, **fields):
+        columns = [name for name in fields if name in EVENT_FIELDS or name == "date"]
+        if not columns:
+            return
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        with self.conn:
+            self.conn.execute(f"UPDATE events SET {assignments} WHERE id = ?",
+                              [fields[name] for name in columns] + [event_id])
+        self.tree_cache.clear()
+
+    def delete_event(self, event_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        self.tree_cache.clear()
+
+    def add_sticker(self, date_key, sticker):
+        with self.conn:
+            self.conn.execute("INSERT INTO stickers (date, sticker) VALUES (?, ?)",
+                              (date_key, sticker))
+
+    def import_batch(self, events, series=()):
+        """Insert many (date_key, event) pairs and (event, rule) series in one transaction"""
+        with self.conn:
+            for date_key, event in events:
+                self._insert_event(date_key, event)
+            for event, rule in series:
+                self._insert_series(event, rule)
+        self.invalidate_caches()
+
+    def invalidate_caches(self):
+        # Needed after another connection (e.g. a background import) wrote to the file
+        self.rules.clear()
+        self.occurrence_cache.invalidate()
+        self.tree_cache.clear()
+
+    def iter_events(self):
+        """Stream every one-off event in date order without loading them all"""
+        for row in self.conn.execute("SELECT * FROM events ORDER BY date, time, id"):
+            yield dict(row)
+
+    def iter_series(self):
+        for row in self.conn.execute("SELECT * FROM series ORDER BY start_date, id"):
+            yield dict(row), RecurrenceRule.from_dict(json.loads(row["rule"]))
+
+    def events_on(self, date_key):
+        return self.events_between(date_key, date_key)
+
+    def events_between(self, start_key, end_key):
+        """Events with start_key <= date <= end_key, ordered by date and time"""
+        rows = self.conn.execute(
+            "SELECT * FROM events WHERE date BETWEEN ? AND ? ORDER BY date, time, id",
+            (start_key, end_key))
+        return [dict(row) for row in rows]
+
+    def stickers_on(self, date_key):
+        rows = self.conn.execute(
+            "SELECT sticker FROM stickers WHERE date = ? ORDER BY id", (date_key,))
+        return [row[0] for row in rows]
+
+    def has_stickers(self, date_key):
+        row = self.conn.execute(
+            "SELECT 1 FROM stickers WHERE date = ? LIMIT 1", (date_key,)).fetchone()
+        return row is not None
+
+    def sticker_dates_between(self, start_key, end_key):
+        rows = self.conn.execute(
+            "SELECT DISTINCT date FROM stickers WHERE date BETWEEN ? AND ? ORDER BY date",
+            (start_key, end_key))
+        return [row[0] for row in rows]
+
+    def month(self, year, month):
+        """{date_key: {"events": [...], "stickers": [...]}} for one month"""
+        start_key, end_key = month_range(year, month)
+        days = {}
+        for event in self.events_between(start_key, end_key):
+            days.setdefault(event["date"], {"events": [], "stickers": []})["events"].append(event)
+        rows = self.conn.execute(
+            "SELECT date, sticker FROM stickers WHERE date BETWEEN ? AND ? ORDER BY date, id",
+            (start_key, end_key))
+        for date_key, sticker in rows:
+            days.setdefault(date_key, {"events": [], "stickers": []})["stickers"].append(sticker)
+        return days
+
+    def add_series(self, event, rule):
+        """Store a recurring event once; occurrences are expanded on demand"""
+        with self.conn:
+            series_id = self._insert_series(event, rule)
+        self.tree_cache.clear()
+        return series_id
+
+    def _insert_series(self, event, rule):
+        last = rule.last_date()
+        cursor = self.conn.execute(
+            "INSERT INTO series (start_date, last_date, time, title, category, "
+            "description, created, remind_minutes, duration, rule) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (rule.start.isoformat(), last.isoformat() if last else None,
+             event.get("time", "00:00"), event.get("title", ""),
+             event.get("category", ""), event.get("description", ""),
+             event.get("created") or datetime.now().isoformat(),
+             event.get("remind_minutes"), event.get("duration") or DEFAULT_EVENT_MINUTES,
+             json.dumps(rule.to_dict())))
+        return cursor.lastrowid
+
+    def update_series_rule(self, series_id, rule):
+        last = rule.last_date()
+        with self.conn:
+            self.conn.execute(
+                "UPDATE series SET start_date = ?, last_date = ?, rule = ?, "
+                "version = version + 1 WHERE id = ?",
+                (rule.start.isoformat(), last.isoformat() if last else None,
+                 json.dumps(rule.to_dict()), series_id))
+        self.rules.pop(series_id, None)
+        self.occurrence_cache.invalidate(series_id)
+        self.tree_cache.clear()
+
+    def skip_occurrence(self, series_id, date_key):
+        rule = self.get_rule(series_id)
+        if rule is not None:
+            rule.exdates.add(datetime.strptime(date_key, "%Y-%m-%d").date())
+            self.update_series_rule(series_id, rule)
+
+    def delete_series(self, series_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM series WHERE id = ?", (series_id,))
+        self.rules.pop(series_id, None)
+        self.occurrence_cache.invalidate(series_id)
+        self.tree_cache.clear()
+
+    def get_rule(self, series_id):
+        row = self.conn.execute("SELECT rule FROM series WHERE id = ?", (series_id,)).fetchone()
+        return RecurrenceRule.from_dict(json.loads(row[0])) if row else None
+
+    def _rule_for(self, row):
+        cached = self.rules.get(row["id"])
+        if cached is None or cached[0] != row["version"]:
+            cached = (row["version"], RecurrenceRule.from_dict(json.loads(row["rule"])))
+            self.rules[row["id"]] = cached
+        return cached[1]
+
+    def series_between(self, start_key, end_key):
+        rows = self.conn.execute(
+            "SELECT * FROM series WHERE start_date <= ? AND (last_date IS NULL OR last_date >= ?)",
+            (end_key, start_key))
+        return [dict(row) for row in rows]
+
+    def occurrences_between(self, start_key, end_key):
+        """One-off events plus recurring occurrences in the window, ordered by date and time"""
+        events = self.events_between(start_key, end_key)
+        for row in self.series_between(start_key, end_key):
+            rule = self._rule_for(row)
+            for date_key in self.occurrence_cache.get(row["id"], row["version"], rule,
+                                                      start_key, end_key):
+                events.append({
+                    "id": None,
+                    "series_id": row["id"],
+                    "date": date_key,
+                    "time": row["time"],
+                    "title": row["title"],
+                    "category": row["category"],
+                    "description": row["description"],
+                    "created": row["created"],
+                    "remind_minutes": row["remind_minutes"],
+                    "duration": row["duration"],
+                })
+        events.sort(key=lambda event: (event["date"], event["time"]))
+        return events
+
+    def _invalidate_trees(self, date_key):
+        # Trees also hold the day before their window (see interval_tree), so
+        # a write on date_key affects windows starting up to the day after it
+        next_day = (datetime.strptime(date_key, "%Y-%m-%d")
+                    + timedelta(days=1)).strftime("%Y-%m-%d")
+        for key in [key for key in self.tree_cache if key[0] <= next_day and date_key <= key[1]]:
+            del self.tree_cache[key]
+
+    def interval_tree(self, start_key, end_key):
+        """IntervalTree of occurrences touching [start_key, end_key], cached until a write"""
+        key = (start_key, end_key)
+        tree = self.tree_cache.get(key)
+        if tree is None:
+            # Start a day early so events running past midnight are included
+            load_from = (datetime.strptime(start_key, "%Y-%m-%d")
+                         - timedelta(days=1)).strftime("%Y-%m-%d")
+            intervals = []
+            for event in self.occurrences_between(load_from, end_key):
+                try:
+                    start = datetime.strptime(f"{event['date']} {event['time']}", "%Y-%m-%d %H:%M")
+                except ValueError:
+                    continue
+                event["start"] = start
+                event["end"] = start + timedelta(minutes=event.get("duration") or DEFAULT_EVENT_MINUTES)
+                intervals.append((event["start"], event["end"], event))
+            tree = IntervalTree(intervals)
+            if len(self.tree_cache) >= 64:
+                self.tree_cache.clear()
+            self.tree_cache[key] = tree
+        return tree
+
+    def conflicts(self, start, minutes):
+        """Events overlapping [start, start + minutes)"""
+        end = start + timedelta(minutes=minutes)
+        tree = self.interval_tree(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+        return tree.overlapping(start, end)
+
+    def day_count(self, date_key):
+        """Stored events plus stickers on one day, recurring occurrences included"""
+        row = self.conn.execute(
+            "SELECT events + stickers FROM day_counts WHERE date = ?", (date_key,)).fetchone()
+        count = row[0] if row else 0
+        for series in self.series_between(date_key, date_key):
+            count += len(self.occurrence_cache.get(series["id"], series["version"],
+                                                   self._rule_for(series), date_key, date_key))
+        return count
+
+    def year_counts(self, year):
+        """{date_key: activity count} for every active day of the year"""
+        start_key, end_key = f"{year:04d}-01-01", f"{year:04d}-12-31"
+        counts = dict(self.conn.execute(
+            "SELECT date, events + stickers FROM day_counts "
+            "WHERE date BETWEEN ? AND ? AND events + stickers > 0", (start_key, end_key)))
+        for series in self.series_between(start_key, end_key):
+            for date_key in self.occurrence_cache.get(series["id"], series["version"],
+                                                      self._rule_for(series), start_key, end_key):
+                counts[date_key] = counts.get(date_key, 0) + 1
+        return counts
+
+    def search(self, text, limit=200):
+        """Events and series matching every word (as a prefix) of `text`, ordered by date and time.
+
+        Series are reported at their next occurrence from today, or their first
+        one if the series has already ended.
+        """
+        words = re.findall(r"\w+", text)
+        if not words:
+            return []
+
+        if self.has_fts:
+            query = " ".join(f'"{word}"*' for word in words)
+            events = self.conn.execute(
+                "SELECT events.* FROM events_fts JOIN events ON events.id = events_fts.rowid "
+                "WHERE events_fts MATCH ? ORDER BY events.date, events.time LIMIT ?",
+                (query, limit))
+            series = self.conn.execute(
+                "SELECT series.* FROM series_fts JOIN series ON series.id = series_fts.rowid "
+                "WHERE series_fts MATCH ? LIMIT ?", (query, limit))
+        else:
+            where = " AND ".join(["(title || ' ' || description || ' ' || category) LIKE ?"] * len(words))
+            params = [f"%{word}%" for word in words]
+            events = self.conn.execute(
+                f"SELECT * FROM events WHERE {where} ORDER BY date, time LIMIT ?", params + [limit])
+            series = self.conn.execute(f"SELECT * FROM series WHERE {where} LIMIT ?", params + [limit])
+
+        results = [dict(row) for row in events]
+        today = datetime.now().date()
+        for row in series:
+            row = dict(row)
+            rule = self._rule_for(row)
+            upcoming = next(rule.occurrences(today, today + timedelta(days=366)), None)
+            row["date"] = (upcoming or rule.start).isoformat()
+            row["series_id"] = row.pop("id")
+            row["id"] = None
+            results.append(row)
+        results.sort(key=lambda event: (event["date"], event["time"]))
+        return results[:limit]
+
+    def category_slot_counts(self, weekday, first_hour, last_hour):
+        """[(category, hour, count)] for one weekday and an hour range, busiest first"""
+        rows = self.conn.execute(
+            "SELECT category, hour, count FROM category_slots "
+            "WHERE weekday = ? AND hour BETWEEN ? AND ? AND count > 0 ORDER BY count DESC",
+            (weekday, first_hour, last_hour))
+        return [tuple(row) for row in rows]
+
+    def habitual_titles(self, min_count):
+        """[(title, weekday, count, last_date)] for titles repeated on the same weekday"""
+        rows = self.conn.execute(
+            "SELECT title, weekday, count, last_date FROM title_weekdays "
+            "WHERE count >= ? ORDER BY count DESC", (min_count,))
+        return [tuple(row) for row in rows]
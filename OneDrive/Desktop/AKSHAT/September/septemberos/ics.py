@@ -0,0 +1,289 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from .recurrence import RecurrenceRule
+
+
+ICS_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+ICS_FREQUENCIES = {"DAILY": "daily", "WEEKLY": "weekly", "MONTHLY": "monthly"}
+
+
+def unfold_lines(raw_lines, on_bytes=None):
+    """Yield logical iCalendar lines, joining folded continuation lines.
+
+    `raw_lines` is any iterable of bytes lines (e.g. a file opened in 'rb'),
+    so only the current line is ever held in memory.
+    """
+    pending = None
+    for raw in raw_lines:
+        if on_bytes:
+            on_bytes(len(raw))
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+
+def split_property(line):
+    """'DTSTART;TZID=X:20250901T100000' -> ('DTSTART', {'TZID': 'X'}, '20250901T100000')"""
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parameters[key.upper()] = param_value
+    return name.upper(), parameters, value
+
+
+def iter_vevents(lines):
+    """Yield one {NAME: [(params, value), ...]} dict per VEVENT"""
+    current = None
+    depth = 0
+    for line in lines:
+        name, params, value = split_property(line)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            current, depth = {}, 0
+        elif current is not None and name == "BEGIN":
+            depth += 1  # Nested components such as VALARM are skipped
+        elif current is not None and name == "END":
+            if value.upper() == "VEVENT":
+                yield current
+                current = None
+            else:
+                depth -= 1
+        elif current is not None and depth == 0:
+            current.setdefault(name, []).append((params, value))
+
+
+def unescape_text(value):
+    return (value.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",")
+            .replace("\\;", ";").replace("\\\\", "\\"))
+
+
+def escape_text(value):
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\n", "\\n"))
+
+
+def parse_ics_datetime(value):
+    """Floating/UTC DATE or DATE-TIME -> naive datetime (UTC values become local time)"""
+    value = value.strip()
+    if len(value) == 8:
+        return datetime.strptime(value, "%Y%m%d")
+    if value.endswith("Z"):
+        return _utc_to_local(datetime.strptime(value[:15], "%Y%m%dT%H%M%S"))
+    return datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+
+
+def _utc_to_local(utc):
+    timestamp = (utc - datetime(1970, 1, 1)).total_seconds()
+    return datetime.fromtimestamp(timestamp)
+
+
+def parse_ics_duration(value):
+    """'PT1H30M' / 'P1D' -> minutes"""
+    value = value.lstrip("+").upper()
+    minutes, number = 0, ""
+    for char in value:
+        if char.isdigit():
+            number += char
+        elif char in "WDHMS" and number:
+            minutes += int(number) * {"W": 10080, "D": 1440, "H": 60, "M": 1, "S": 0}[char]
+            number = ""
+    return minutes
+
+
+def parse_rrule(value, start, exdates):
+    parts = dict(part.partition("=")[::2] for part in value.upper().split(";") if part)
+    freq = ICS_FREQUENCIES.get(parts.get("FREQ"))
+    if not freq:
+        return None
+    weekdays = [ICS_WEEKDAYS.index(day[-2:]) for day in parts.get("BYDAY", "").split(",")
+                if day[-2:] in ICS_WEEKDAYS] if freq == "weekly" else None
+    until = parse_ics_datetime(parts["UNTIL"]).date() if "UNTIL" in parts else None
+    count = int(parts["COUNT"]) if parts.get("COUNT", "").isdigit() else None
+    return RecurrenceRule(start, freq, int(parts.get("INTERVAL", "1") or 1),
+                          weekdays, until, count, exdates)
+
+
+def vevent_to_event(properties):
+    """Map a parsed VEVENT to (date_key, SepTempo event dict, RecurrenceRule or None)"""
+    def first(name, default=""):
+        values = properties.get(name)
+        return values[0][1] if values else default
+
+    if "DTSTART" not in properties:
+        return None
+    start = parse_ics_datetime(first("DTSTART"))
+    if "DTEND" in properties:
+        duration = int((parse_ics_datetime(first("DTEND")) - start).total_seconds() // 60)
+    elif "DURATION" in properties:
+        duration = parse_ics_duration(first("DURATION"))
+    else:
+        duration = 0
+    categories = first("CATEGORIES")
+
+    event = {
+        "title": unescape_text(first("SUMMARY", "Untitled")),
+        "time": start.strftime("%H:%M"),
+        "category": unescape_text(categories.split(",")[0]) if categories else "📅 Imported",
+        "description": unescape_text(first("DESCRIPTION")),
+        "created": datetime.now().isoformat(),
+        "duration": duration if duration > 0 else None,
+    }
+
+    rule = None
+    if "RRULE" in properties:
+        exdates = [parse_ics_datetime(value).date()
+                   for _, values in properties.get("EXDATE", [])
+                   for value in values.split(",") if value]
+        rule = parse_rrule(first("RRULE"), start.date(), exdates)
+    return start.strftime("%Y-%m-%d"), event, rule
+
+
+def import_ics(store, path, batch_size=500, progress=None, should_cancel=None):
+    """Stream an .ics file into the event store, committing every `batch_size` events.
+
+    `progress(bytes_done, bytes_total)` is called after each batch; when
+    `should_cancel()` returns True the import stops and batches already
+    committed are kept. Returns the number of imported events and series.
+    """
+    total = os.path.getsize(path)
+    done = [0]
+    imported = 0
+    events, series = [], []
+
+    def on_bytes(count):
+        done[0] += count
+
+    with open(path, "rb") as f:
+        for properties in iter_vevents(unfold_lines(f, on_bytes)):
+            try:
+                parsed = vevent_to_event(properties)
+            except ValueError:
+                continue
+            if parsed is None:
+                continue
+            date_key, event, rule = parsed
+            if rule is not None:
+                series.append((event, rule))
+            else:
+                events.append((date_key, event))
+
+            if len(events) + len(series) >= batch_size:
+                store.import_batch(events, series)
+                imported += len(events) + len(series)
+                events, series = [], []
+                if progress:
+                    progress(done[0], total)
+                if should_cancel and should_cancel():
+                    return imported
+
+    if events or series:
+        store.import_batch(events, series)
+        imported += len(events) + len(series)
+    if progress:
+        progress(total, total)
+    return imported
+
+
+def format_ics_datetime(date_key, time):
+    return f"{date_key.replace('-', '')}T{time.replace(':', '')}00"
+
+
+def format_rrule(rule):
+    parts = [f"FREQ={rule.freq.upper()}"]
+    if rule.interval > 1:
+        parts.append(f"INTERVAL={rule.interval}")
+    if rule.freq == "weekly":
+        parts.append("BYDAY=" + ",".join(ICS_WEEKDAYS[day] for day in rule.weekdays))
+    if rule.until:
+        # Same value type as the DATE-TIME DTSTART, covering the whole last day
+        parts.append(f"UNTIL={rule.until.strftime('%Y%m%d')}T235959")
+    if rule.count:
+        parts.append(f"COUNT={rule.count}")
+    return ";".join(parts)
+
+
+def fold_line(line):
+    # RFC 5545 lines are at most 75 octets; continuation lines start with a space
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    chunks, current = [], b""
+    for char in line:
+        piece = char.encode("utf-8")
+        if len(current) + len(piece) > (75 if not chunks else 74):
+            chunks.append(current.decode("utf-8"))
+            current = b""
+        current += piece
+    chunks.append(current.decode("utf-8"))
+    return "\r\n ".join(chunks) + "\r\n"
+
+
+def vevent_lines(uid, event, rule=None):
+    start = datetime.strptime(f"{event['date']} {event['time']}", "%Y-%m-%d %H:%M")
+    end = start + timedelta(minutes=event.get("duration") or 60)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}@septemberos",
+        f"DTSTAMP:{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}",
+        f"DTSTART:{format_ics_datetime(event['date'], event['time'])}",
+        f"DTEND:{end.strftime('%Y%m%dT%H%M%S')}",
+        f"SUMMARY:{escape_text(event['title'])}",
+    ]
+    if event.get("category"):
+        lines.append(f"CATEGORIES:{escape_text(event['category'])}")
+    if event.get("description"):
+        lines.append(f"DESCRIPTION:{escape_text(event['description'])}")
+    if rule is not None:
+        lines.append(f"RRULE:{format_rrule(rule)}")
+        if rule.exdates:
+            lines.append("EXDATE:" + ",".join(
+                format_ics_datetime(d.isoformat(), event["time"]) for d in sorted(rule.exdates)))
+    lines.append("END:VEVENT")
+    return lines
+
+
+def export_ics(store, path, progress=None, should_cancel=None):
+    """Write the whole calendar to an .ics file one event at a time.
+
+    A cancelled export leaves `path` untouched and returns 0.
+    """
+    exported = 0
+    cancelled = False
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="") as f:
+        f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//SeptemberOS//SepTempo//EN\r\n")
+        for event in store.iter_events():
+            for line in vevent_lines(f"event-{event['id']}", event):
+                f.write(fold_line(line))
+            exported += 1
+            if exported % 500 == 0:
+                if progress:
+                    progress(exported)
+                if should_cancel and should_cancel():
+                    cancelled = True
+                    break
+        if not cancelled:
+            for row, rule in store.iter_series():
+                event = dict(row, date=row["start_date"])
+                for line in vevent_lines(f"series-{row['id']}", event, rule):
+                    f.write(fold_line(line))
+                exported += 1
+                if exported % 500 == 0 and should_cancel and should_cancel():
+                    cancelled = True
+                    break
+        f.write("END:VCALENDAR\r\n")
+    if cancelled:
+        os.remove(temp_path)
+        return 0
+    os.replace(temp_path, path)
+    if progress:
+        progress(exported)
+    return exported
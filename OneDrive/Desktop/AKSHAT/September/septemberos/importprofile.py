@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+
+
+# Modules that must stay out of `import septemberos.app`; each one is
+# imported by the code that first needs it
+DEFERRED_MODULES = (
+    "markdown2",
+    "pygame",
+    "requests",
+    "septemberos.lofiboard",
+    "septemberos.studynest",
+    "septemberos.equinox",
+    "septemberos.septempo",
+    "septemberos.leaflet",
+)
+
+CHECK_SCRIPT = (
+    "import sys\n"
+    "import septemberos.app\n"
+    f"for name in {DEFERRED_MODULES!r}:\n"
+    "    if name in sys.modules:\n"
+    "        print(name)\n"
+)
+
+
+class ImportNode:
+    def __init__(self, name, self_us, cumulative_us):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = []
+
+
+def parse_importtime(lines):
+    """Build the import tree from `python -X importtime` output.
+
+    Lines look like 'import time:  self | cumulative |   name'. The name is
+    indented two spaces per level, and a module is printed after everything
+    it imported, so pending nodes are collected per depth until their parent
+    shows up.
+    """
+    pending = {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        raw_name = fields[2].rstrip()
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        node = ImportNode(raw_name.strip(), int(fields[0]), int(fields[1]))
+        node.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def format_tree(nodes, min_us=1000, depth=0):
+    lines = []
+    for node in sorted(nodes, key=lambda n: n.cumulative_us, reverse=True):
+        if node.cumulative_us < min_us:
+            continue
+        lines.append(f"{node.cumulative_us / 1000:9.1f} ms {node.self_us / 1000:9.1f} ms  "
+                     f"{'  ' * depth}{node.name}")
+        lines.extend(format_tree(node.children, min_us, depth + 1))
+    return lines
+
+
+def profile_imports(min_ms=1.0):
+    """Import septemberos.app in a fresh interpreter and report where the time goes.
+
+    Returns the exit status: 1 if any DEFERRED_MODULES were imported eagerly.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", CHECK_SCRIPT],
+                            cwd=root, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr)
+        return result.returncode
+
+    roots = parse_importtime(result.stderr.splitlines())
+    app = [node for node in roots if node.name == "septemberos.app"]
+    print(f"{'cumulative':>12} {'self':>12}  module (>= {min_ms:g} ms)")
+    print("\n".join(format_tree(app, min_ms * 1000)))
+    total = sum(node.cumulative_us for node in roots)
+    print(f"\nTotal import time: {total / 1000:.1f} ms "
+          f"(septemberos.app: {sum(n.cumulative_us for n in app) / 1000:.1f} ms)")
+
+    eager = result.stdout.split()
+    if eager:
+        print("\nImported eagerly but should be deferred: " + ", ".join(eager))
+        return 1
+    print("\nNo deferred module was imported eagerly.")
+    return 0
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from .planner import free_intervals
+
+
+class IntervalTree:
+    """Static interval tree over (start, end, payload) half-open intervals.
+
+    Intervals are sorted by start and viewed as an implicit balanced binary
+    tree (the middle element of every range is its root). Each node stores the
+    largest end in its subtree, so an overlap query prunes whole subtrees and
+    runs in O(log n + k).
+    """
+
+    def __init__(self, intervals=()):
+        self.items = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self.max_end = [None] * len(self.items)
+        self._build(0, len(self.items))
+
+    def __len__(self):
+        return len(self.items)
+
+    def _build(self, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        best = self.items[mid][1]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > best:
+                best = child
+        self.max_end[mid] = best
+        return best
+
+    def overlapping(self, start, end):
+        """Payloads of intervals with item_start < end and item_end > start"""
+        found = []
+        stack = [(0, len(self.items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_end[mid] <= start:
+                continue  # Nothing in this subtree ends after the query starts
+            stack.append((lo, mid))
+            item_start, item_end, payload = self.items[mid]
+            if item_start < end:
+                if item_end > start:
+                    found.append(payload)
+                stack.append((mid + 1, hi))
+        return found
+
+
+def find_free_slot(tree, window_start, window_end, minutes):
+    """Earliest free (start, end) of the given length inside the window, or None"""
+    length = timedelta(minutes=minutes)
+    busy = [(payload["start"], payload["end"])
+            for payload in tree.overlapping(window_start, window_end)]
+    for start, end in free_intervals(window_start, window_end, busy):
+        if end - start >= length:
+            return start, start + length
+    return None
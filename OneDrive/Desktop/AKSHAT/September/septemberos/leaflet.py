@@ -1,4 +1,3 @@
-import json
 import os
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QTextEdit, QComboBox, QGroupBox, QGridLayout, QSlider,
@@ -7,9 +6,10 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushBut
                              QGraphicsLineItem, QFrame)
 from PyQt5.QtCore import Qt, QTimer, QRectF, QPointF, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QPen, QBrush, QPainter
-import random
 import time
-import ast
+from .persistence import load_json, save_json
+from .algorithms import ALGORITHMS, algorithm_steps, parse_algorithm_input
+from .tracing import traced
 
 
 class AlgorithmVisualizer(QGraphicsView):
@@ -42,6 +42,7 @@ class AlgorithmVisualizer(QGraphicsView):
             }
         """)
 
+    @traced()
     def visualize_array(self, array, highlight_indices=None, colors=None):
         self.scene.clear()
 
@@ -172,15 +173,13 @@ class Leaflet(QWidget):
     def load_algorithm_history(self):
         if os.path.exists(self.algorithms_file):
             try:
-                with open(self.algorithms_file, 'r') as f:
-                    return json.load(f)
+                return load_json(self.algorithms_file)
             except:
                 return []
         return []
 
     def save_algorithm_history(self):
-        with open(self.algorithms_file, 'w') as f:
-            json.dump(self.algorithm_history, f, indent=2)
+        save_json(self.algorithms_file, self.algorithm_history, indent=2)
 
     def setup_ui(self):
         main_layout = QHBoxLayout()
@@ -201,11 +200,7 @@ class Leaflet(QWidget):
 
         algo_layout.addWidget(QLabel("Algorithm Type:"), 0, 0)
         self.algorithm_combo = QComboBox()
-        algorithms = [
-            "Bubble Sort", "Selection Sort", "Insertion Sort", "Merge Sort",
-            "Quick Sort", "Binary Search", "Linear Search", "DFS", "BFS"
-        ]
-        self.algorithm_combo.addItems(algorithms)
+        self.algorithm_combo.addItems(ALGORITHMS)
         algo_layout.addWidget(self.algorithm_combo, 0, 1)
 
         algo_layout.addWidget(QLabel("Input Data:"), 1, 0)
@@ -334,16 +329,7 @@ class Leaflet(QWidget):
         input_text = self.input_data.toPlainText().strip()
 
         # Parse input or generate random data
-        if input_text:
-            try:
-                if input_text.startswith('[') and input_text.endswith(']'):
-                    data = ast.literal_eval(input_text)
-                else:
-                    data = [int(x.strip()) for x in input_text.split(',')]
-            except:
-                data = [random.randint(1, 99) for _ in range(8)]
-        else:
-            data = [random.randint(1, 99) for _ in range(8)]
+        data = parse_algorithm_input(input_text)
 
         # Generate algorithm steps
         steps = self.generate_algorithm_steps(algorithm, data)
@@ -371,75 +357,10 @@ class Leaflet(QWidget):
             # Generate initial tips
             self.generate_copilot_tips()
 
+    @traced()
     def generate_algorithm_steps(self, algorithm, data):
         """Generate step-by-step visualization data for algorithms"""
-        steps = []
-
-        if algorithm == "Bubble Sort":
-            arr = data.copy()
-            steps.append({
-                'type': 'array',
-                'data': arr.copy(),
-                'description': "Initial array - Bubble Sort will compare adjacent elements"
-            })
-
-            n = len(arr)
-            for i in range(n):
-                for j in range(0, n - i - 1):
-                    # Highlight comparison
-                    steps.append({
-                        'type': 'array',
-                        'data': arr.copy(),
-                        'highlight': [j, j + 1],
-                        'description': f"Comparing elements at positions {j} and {j+1}: {arr[j]} vs {arr[j+1]}"
-                    })
-
-                    if arr[j] > arr[j + 1]:
-                        arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                        steps.append({
-                            'type': 'array',
-                            'data': arr.copy(),
-                            'colors': ['#90EE90' if k == j or k == j+1 else '#CD853F' for k in range(len(arr))],
-                            'description': f"Swapped {arr[j+1]} and {arr[j]} - array is now: {arr}"
-                        })
-
-        elif algorithm == "Linear Search":
-            arr = data.copy()
-            # Search for middle element
-            target = arr[len(arr)//2] if arr else 0
-
-            steps.append({
-                'type': 'array',
-                'data': arr.copy(),
-                'description': f"Linear Search: Looking for {target} in the array"
-            })
-
-            for i, val in enumerate(arr):
-                steps.append({
-                    'type': 'array',
-                    'data': arr.copy(),
-                    'highlight': [i],
-                    'description': f"Checking position {i}: {val} {'==' if val == target else '!='} {target}"
-                })
-
-                if val == target:
-                    steps.append({
-                        'type': 'array',
-                        'data': arr.copy(),
-                        'colors': ['#90EE90' if k == i else '#CD853F' for k in range(len(arr))],
-                        'description': f"Found {target} at position {i}! Search complete."
-                    })
-                    break
-
-        else:
-            # Default case - just show the array
-            steps.append({
-                'type': 'array',
-                'data': data,
-                'description': f"{algorithm} visualization - This is a simplified demo"
-            })
-
-        return steps
+        return algorithm_steps(algorithm, data)
 
     def play_animation(self):
         if hasattr(self.visualizer, 'algorithm_steps') and self.visualizer.algorithm_steps:
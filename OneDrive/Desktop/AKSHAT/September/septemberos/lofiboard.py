@@ -1,5 +1,3 @@
-import json
-import os
 import time
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
@@ -8,14 +6,18 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
                              QMessageBox, QInputDialog, QGroupBox, QTreeWidget, QTreeWidgetItem)
 from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect
 from PyQt5.QtGui import QFont, QColor, QIcon
-import markdown2
 from .animations import GlowEffect, PulsingWidget
+from .persistence import save_json
+from .notes import (NOTES_FILE, CATEGORIES_FILE, load_notes, load_categories,
+                    filter_notes)
+from .tracing import traced
+from .metrics import measured
 
 class LoFiBoard(QWidget):
     def __init__(self):
         super().__init__()
-        self.notes_file = "notes_database.json"
-        self.categories_file = "note_categories.json"
+        self.notes_file = NOTES_FILE
+        self.categories_file = CATEGORIES_FILE
         self.notes = self.load_notes()
         self.categories = self.load_categories()
         self.current_note_id = None
@@ -249,69 +251,44 @@ class LoFiBoard(QWidget):
         
     def animate_falling_leaves(self):
         # Simple animation by updating window title with falling leaf emoji
-        current_title = self.parent().parent().windowTitle()
+        window = self.window()
+        if window is self:
+            return  # Not inside the main window yet
+        current_title = window.windowTitle()
         if "🍂" not in current_title:
-            self.parent().parent().setWindowTitle(current_title + " 🍂")
+            window.setWindowTitle(current_title + " 🍂")
+        # The leaf only has to be added once
+        self.animation_timer.stop()
+        
+    def suspend(self):
+        """Called by the main window while this tab is hidden or minimized"""
+        self.animation_timer.stop()
+        
+    def resume(self):
+        self.animate_falling_leaves()
         
     def load_categories(self):
-        if os.path.exists(self.categories_file):
-            try:
-                with open(self.categories_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {"General": "📋", "Ideas": "💡", "Tasks": "✅", "Personal": "🔒"}
-        return {"General": "📋", "Ideas": "💡", "Tasks": "✅", "Personal": "🔒"}
+        return load_categories(self.categories_file)
     
     def save_categories(self):
-        with open(self.categories_file, 'w', encoding='utf-8') as f:
-            json.dump(self.categories, f, indent=2, ensure_ascii=False)
+        save_json(self.categories_file, self.categories, indent=2, ensure_ascii=False)
     
     def load_notes(self):
-        if os.path.exists(self.notes_file):
-            try:
-                with open(self.notes_file, 'r', encoding='utf-8') as f:
-                    loaded_notes = json.load(f)
-                    # Migrate old format if needed
-                    for note_id, note_data in loaded_notes.items():
-                        if 'category' not in note_data:
-                            note_data['category'] = 'General'
-                        if 'id' not in note_data:
-                            note_data['id'] = note_id
-                    return loaded_notes
-            except:
-                return {}
-        return {}
+        return load_notes(self.notes_file)
     
+    @traced()
     def save_notes(self):
-        with open(self.notes_file, 'w', encoding='utf-8') as f:
-            json.dump(self.notes, f, indent=2, ensure_ascii=False)
+        save_json(self.notes_file, self.notes, indent=2, ensure_ascii=False)
     
+    @traced()
     def refresh_notes_list(self):
         self.notes_list.clear()
         
-        # Filter notes based on current category and search
-        filtered_notes = {}
+        # Filter notes based on current category and search, newest first
         search_text = getattr(self, 'search_input', None)
-        search_term = search_text.text().lower() if search_text else ""
-        
-        for note_id, note_data in self.notes.items():
-            # Category filter
-            if self.current_category != "All Notes" and note_data.get('category', 'General') != self.current_category:
-                continue
-                
-            # Search filter
-            if search_term:
-                title = note_data.get('title', '').lower()
-                content = note_data.get('content', '').lower()
-                if search_term not in title and search_term not in content:
-                    continue
-                    
-            filtered_notes[note_id] = note_data
-            
-        # Sort notes by creation date (newest first)
-        sorted_notes = sorted(filtered_notes.items(), 
-                            key=lambda x: x[1].get('created', ''), 
-                            reverse=True)
+        search_term = search_text.text() if search_text else ""
+        category = self.current_category if self.current_category != "All Notes" else None
+        sorted_notes = filter_notes(self.notes, search_term, category)
         
         for note_id, note_data in sorted_notes:
             title = note_data.get('title', 'Untitled Note')
@@ -404,12 +381,32 @@ class LoFiBoard(QWidget):
         self.refresh_notes_list()
         
         # Select the new note automatically
+        self.select_note(note_id)
+    
+    def select_note(self, note_id):
         for i in range(self.notes_list.topLevelItemCount()):
             item = self.notes_list.topLevelItem(i)
             if item.data(0, Qt.UserRole) == note_id:
                 self.notes_list.setCurrentItem(item)
                 self.load_selected_note(item, 0)
-                break
+                return True
+        return False
+    
+    def open_note(self, key):
+        """Show a note given its id or title (exact, else partial match); False if none matches"""
+        note_id = key if key in self.notes else None
+        if note_id is None:
+            key = key.lower()
+            titles = [(nid, note.get('title', '').lower()) for nid, note in filter_notes(self.notes)]
+            note_id = next((nid for nid, title in titles if title == key), None)
+            if note_id is None:
+                note_id = next((nid for nid, title in titles if key in title), None)
+        if note_id is None:
+            return False
+        # The note may be hidden by the current category or search
+        self.search_input.clear()
+        self.category_combo.setCurrentText("All Notes")
+        return self.select_note(note_id)
     
     def load_selected_note(self, item, column=0):
         if not item:
@@ -470,7 +467,10 @@ class LoFiBoard(QWidget):
                 if not current_title.endswith(new_title):
                     self.refresh_notes_list()
     
+    @traced()
+    @measured("render.markdown_preview")
     def update_preview(self):
+        import markdown2  # Deferred: only needed once a note is previewed
         markdown_text = self.editor.toPlainText()
         html = markdown2.markdown(markdown_text, extras=['fenced-code-blocks', 'tables'])
         self.preview.setHtml(html)
@@ -0,0 +1,194 @@
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+# A key is flagged once this many snapshots in a row never shrank and grew this much
+GROWTH_STREAK = 4
+GROWTH_MIN_BYTES = 64 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def module_for_file(filename):
+    """'.../septemberos/equinox.py' -> 'septemberos.equinox'; other code by top package"""
+    path = os.path.abspath(filename)
+    if path.startswith(PACKAGE_DIR + os.sep):
+        return "septemberos." + os.path.splitext(os.path.relpath(path, PACKAGE_DIR))[0]
+    parts = path.replace("\\", "/").split("/")
+    if "site-packages" in parts:
+        index = parts.index("site-packages")
+        if index + 1 < len(parts):
+            return os.path.splitext(parts[index + 1])[0]
+    return "other"
+
+
+def memory_by_module(snapshot):
+    totals = {}
+    for stat in snapshot.statistics("filename"):
+        module = module_for_file(stat.traceback[0].filename)
+        totals[module] = totals.get(module, 0) + stat.size
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def attribute(snapshot, skip_files=()):
+    """Bytes per module and per innermost septemberos call site, in one pass.
+
+    A QLabel or a stylesheet string is often allocated inside Qt or the
+    standard library; attributing it to the nearest frame in our own code
+    points at the caller that keeps creating them. Traces with a frame in
+    `skip_files` are left out entirely.
+
+    statistics("traceback") groups identical stacks first, so the frames are
+    walked once per distinct stack rather than once per allocation;
+    Snapshot.filter_traces would match every frame of every trace.
+    """
+    modules, sites = {}, {}
+    for stat in snapshot.statistics("traceback"):
+        site = None
+        # tracemalloc orders frames oldest first; walk from the allocation outwards
+        for frame in reversed(stat.traceback):
+            filename = frame.filename
+            if filename in skip_files:
+                break
+            if site is None and filename.startswith(PACKAGE_DIR):
+                site = f"{module_for_file(filename)}:{frame.lineno}"
+        else:
+            module = module_for_file(stat.traceback[-1].filename)
+            modules[module] = modules.get(module, 0) + stat.size
+            if site is not None:
+                sites[site] = sites.get(site, 0) + stat.size
+    return modules, sites
+
+
+def process_rss():
+    """Resident set size in bytes where the platform makes it cheap to read"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def format_bytes(size):
+    sign = "-" if size < 0 else "+" if size > 0 else " "
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.2f} GiB"
+
+
+class MemoryProfiler:
+    """Periodic tracemalloc snapshots attributed to septemberos modules and call sites.
+
+    Snapshots are taken and attributed on a background thread every
+    `interval` seconds, so grouping tens of thousands of traces never
+    blocks the event loop for long. Only per-key totals are kept between
+    snapshots, never the snapshots themselves, so the profiler's own
+    footprint stays flat over long sessions. Each snapshot rewrites the
+    report file.
+    """
+
+    def __init__(self, report_path="memory_report.txt", frames=12, interval=60.0):
+        self.report_path = report_path
+        self.frames = frames
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = None
+        self.started = None
+        self.rounds = 0
+        self.module_history = {}  # module -> [bytes per snapshot]
+        self.site_history = {}    # "module:line" -> [bytes per snapshot]
+        self.previous_sites = {}
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.started = time.monotonic()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="memory-profiler", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Takes a final snapshot so the report covers the whole session"""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        self.take_snapshot()
+        while not self.stopped.wait(self.interval):
+            self.take_snapshot()
+        self.take_snapshot()
+
+    def take_snapshot(self):
+        # Leave out the profiler's own bookkeeping
+        modules, sites = attribute(tracemalloc.take_snapshot(),
+                                   skip_files={tracemalloc.__file__, __file__})
+        self.rounds += 1
+        for history, totals in ((self.module_history, modules), (self.site_history, sites)):
+            for key in set(history) | set(totals):
+                series = history.setdefault(key, [0] * (self.rounds - 1))
+                series.append(totals.get(key, 0))
+        self.write_report(sites)
+        self.previous_sites = sites
+
+    def growing(self, history):
+        """Keys whose size never dropped over the last GROWTH_STREAK snapshots"""
+        flagged = []
+        for key, series in history.items():
+            recent = series[-GROWTH_STREAK:]
+            if len(recent) < GROWTH_STREAK:
+                continue
+            growth = recent[-1] - recent[0]
+            if growth >= GROWTH_MIN_BYTES and all(b >= a for a, b in zip(recent, recent[1:])):
+                flagged.append((key, growth, series))
+        return sorted(flagged, key=lambda item: item[1], reverse=True)
+
+    def write_report(self, sites):
+        current, peak = tracemalloc.get_traced_memory()
+        rss = process_rss()
+        elapsed = time.monotonic() - self.started
+        lines = [
+            f"SeptemberOS memory report - {datetime.now().isoformat(timespec='seconds')}",
+            f"Snapshots: {self.rounds} over {elapsed / 60:.1f} min",
+            f"Traced: {current / 1024 / 1024:.1f} MiB (peak {peak / 1024 / 1024:.1f} MiB)"
+            + (f", RSS {rss / 1024 / 1024:.1f} MiB" if rss else ""),
+            "",
+            f"Monotonic growth (no drop over the last {GROWTH_STREAK} snapshots, "
+            f"at least {GROWTH_MIN_BYTES // 1024} KiB):",
+        ]
+        flagged = self.growing(self.module_history) + self.growing(self.site_history)
+        if flagged:
+            lines.extend(f"  {format_bytes(growth):>12}  {key}  [{', '.join(f'{b // 1024}K' for b in series[-8:])}]"
+                         for key, growth, series in flagged)
+        else:
+            lines.append("  none")
+
+        lines += ["", "Growth by module since the first snapshot:"]
+        growth = sorted(((series[-1] - series[0], series[-1], key)
+                         for key, series in self.module_history.items()), reverse=True)
+        lines.extend(f"  {format_bytes(delta):>12}  now {size / 1024:9.0f} KiB  {key}"
+                     for delta, size, key in growth[:15])
+
+        lines += ["", "Growth by call site since the first snapshot:"]
+        growth = sorted(((series[-1] - series[0], series[-1], key)
+                         for key, series in self.site_history.items()), reverse=True)
+        lines.extend(f"  {format_bytes(delta):>12}  now {size / 1024:9.0f} KiB  {key}"
+                     for delta, size, key in growth[:20] if delta)
+
+        lines += ["", "Change by call site since the previous snapshot:"]
+        change = sorted(((sites.get(key, 0) - self.previous_sites.get(key, 0), key)
+                         for key in set(sites) | set(self.previous_sites)), reverse=True)
+        lines.extend(f"  {format_bytes(delta):>12}  {key}" for delta, key in change[:10] if delta)
+
+        temp_path = self.report_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.report_path)
@@ -0,0 +1,120 @@
+import functools
+import time
+
+
+# Histogram values are microseconds. Values below 64 get exact buckets; each
+# power of two above that is split into 32 linear sub-buckets, so a recorded
+# value is never off by more than about 3%. The largest bucket covers ~9 days.
+EXACT_BUCKETS = 64
+SUB_BUCKETS = 32
+MAX_SHIFT = 34
+BUCKET_COUNT = EXACT_BUCKETS + MAX_SHIFT * SUB_BUCKETS
+
+
+def bucket_index(value):
+    if value < EXACT_BUCKETS:
+        return value
+    shift = min(value.bit_length() - 6, MAX_SHIFT)
+    top = min(value >> shift, 2 * SUB_BUCKETS - 1)
+    return EXACT_BUCKETS + (shift - 1) * SUB_BUCKETS + (top - SUB_BUCKETS)
+
+
+def bucket_upper_bound(index):
+    if index < EXACT_BUCKETS:
+        return index
+    shift, offset = divmod(index - EXACT_BUCKETS, SUB_BUCKETS)
+    return ((offset + SUB_BUCKETS + 1) << (shift + 1)) - 1
+
+
+class Counter:
+    __slots__ = ("name", "count")
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+
+    def inc(self, amount=1):
+        self.count += amount
+
+
+class Histogram:
+    """HDR-style latency histogram with a fixed bucket array.
+
+    `record` is O(1) and allocates nothing beyond the integers it adds, so it
+    can sit on paint and timer paths permanently.
+    """
+    __slots__ = ("name", "counts", "count", "total", "max")
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        value = int(value) if value > 0 else 0
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+
+    def counter(self, name):
+        counter = self.counters.get(name)
+        if counter is None:
+            counter = self.counters[name] = Counter(name)
+        return counter
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(name)
+        return histogram
+
+
+registry = MetricsRegistry()
+
+
+def counter(name):
+    return registry.counter(name)
+
+
+def histogram(name):
+    return registry.histogram(name)
+
+
+def measured(name):
+    """Decorator recording each call's duration (µs) in the named histogram"""
+    def decorate(function):
+        target = registry.histogram(name)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                target.record((time.perf_counter_ns() - start) // 1000)
+        return wrapper
+    return decorate
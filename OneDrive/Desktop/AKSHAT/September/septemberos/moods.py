@@ -0,0 +1,36 @@
+from collections import Counter
+from datetime import datetime
+
+
+MOOD_FILE = "mood_data.json"
+
+
+def mood_statistics(mood_history, since=None):
+    """Summary of Equinox mood entries, optionally only those logged on or after `since`.
+
+    Entries are keyed by their 'yyyy-MM-dd HH:mm' timestamp, so comparing
+    keys as strings selects a date range.
+    """
+    entries = [entry for key, entry in sorted(mood_history.items())
+               if since is None or key >= since]
+    intensities = [entry.get('intensity', 5) for entry in entries]
+    weekdays = Counter()
+    for entry in entries:
+        weekday = entry.get('day_of_week')
+        if weekday is None:
+            try:
+                weekday = datetime.strptime(entry.get('timestamp', '')[:10], '%Y-%m-%d').strftime('%A')
+            except ValueError:
+                continue
+        weekdays[weekday] += 1
+    moods = Counter(entry.get('mood', '') for entry in entries)
+    return {
+        'entries': len(entries),
+        'first': entries[0].get('timestamp') if entries else None,
+        'last': entries[-1].get('timestamp') if entries else None,
+        'average_intensity': sum(intensities) / len(intensities) if intensities else 0,
+        'most_common': moods.most_common(1)[0][0] if moods else "None",
+        'moods': moods,
+        'weather': Counter(entry['weather'] for entry in entries if entry.get('weather')),
+        'weekdays': weekdays,
+    }
@@ -1,8 +1,22 @@
-import pygame
+import os
 import threading
 
+
+def load_pygame():
+    """Import pygame on first use; it is slow to import and probes audio devices"""
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        import pygame
+    except ImportError:
+        return None
+    return pygame
+
+
 def play_lofi_music():
     def _play():
+        pygame = load_pygame()
+        if pygame is None:
+            return
         try:
             pygame.mixer.init()
             # Placeholder: Replace 'lofi.mp3' with your own cozy lo-fi track
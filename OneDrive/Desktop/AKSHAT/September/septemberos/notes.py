@@ -0,0 +1,46 @@
+import os
+
+from .persistence import load_json
+
+
+NOTES_FILE = "notes_database.json"
+CATEGORIES_FILE = "note_categories.json"
+DEFAULT_CATEGORIES = {"General": "📋", "Ideas": "💡", "Tasks": "✅", "Personal": "🔒"}
+
+
+def load_notes(path=NOTES_FILE):
+    """LoFiBoard notes by id, migrating entries saved before categories existed"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        notes = load_json(path)
+    except (OSError, ValueError):
+        return {}
+    for note_id, note in notes.items():
+        note.setdefault('category', 'General')
+        note.setdefault('id', note_id)
+    return notes
+
+
+def load_categories(path=CATEGORIES_FILE):
+    if os.path.exists(path):
+        try:
+            return load_json(path)
+        except (OSError, ValueError):
+            pass
+    return dict(DEFAULT_CATEGORIES)
+
+
+def filter_notes(notes, search_term="", category=None):
+    """(id, note) pairs matching a category and a case-insensitive search, newest first"""
+    search_term = search_term.lower()
+    matches = []
+    for note_id, note in notes.items():
+        if category and note.get('category', 'General') != category:
+            continue
+        if search_term and (search_term not in note.get('title', '').lower()
+                            and search_term not in note.get('content', '').lower()):
+            continue
+        matches.append((note_id, note))
+    matches.sort(key=lambda item: item[1].get('created', ''), reverse=True)
+    return matches
@@ -0,0 +1,200 @@
+import atexit
+import copy
+import gc
+import json
+import marshal
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+
+from .metrics import counter, histogram
+from .tracing import span
+
+
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_VERSION = 1
+# marshal's format may change between Python releases
+SNAPSHOT_PYTHON = f"{sys.version_info[0]}.{sys.version_info[1]}/{marshal.version}"
+
+
+class PersistenceExecutor:
+    """Single background thread that writes the JSON data files.
+
+    Callers hand over a snapshot and return immediately. Writes queued for a
+    path that is still waiting are coalesced (the newest data wins), and each
+    file is replaced atomically: temp file, fsync, rename. `flush()` blocks
+    until everything queued so far is on disk. The same thread rebuilds the
+    binary snapshots used by `load_json`; a save only deletes the old one.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending = {}  # path -> (function, args) of the newest job for it
+        self.busy = False
+        self.thread = None
+        self.coalesced = counter("persist.coalesced")
+        self.write_time = histogram("persist.write")
+
+    def save_json(self, path, data, **dump_kwargs):
+        self.submit(path, write_json_atomic, path, snapshot_json(data), dump_kwargs)
+
+    def rebuild_snapshot(self, path):
+        self.submit(path + SNAPSHOT_SUFFIX, rebuild_snapshot, path)
+
+    def submit(self, key, function, *args):
+        with self.condition:
+            # Re-queue at the back with the newest data
+            if self.pending.pop(key, None) is not None:
+                self.coalesced.inc()
+            self.pending[key] = (function, args)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="persistence", daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every queued write has finished; False on timeout"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending)
+                key = next(iter(self.pending))
+                function, args = self.pending.pop(key)
+                self.busy = True
+            started = time.perf_counter_ns()
+            try:
+                with span(f"persist {os.path.basename(key)}"):
+                    function(*args)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Failed to save {key}: {e}")
+            finally:
+                self.write_time.record((time.perf_counter_ns() - started) // 1000)
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+
+def snapshot_json(data):
+    # The GUI keeps mutating its dicts, so the writer needs its own copy;
+    # marshal round-trips plain JSON data much faster than deepcopy
+    try:
+        return marshal.loads(marshal.dumps(data))
+    except ValueError:
+        return copy.deepcopy(data)
+
+
+def write_json_atomic(path, data, dump_kwargs):
+    raw = json.dumps(data, **dump_kwargs).encode("utf-8")
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    if os.name != "nt":
+        # Make the rename itself durable
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+    # Re-parsing here would hold the GIL for the whole file and stall the GUI,
+    # so the now stale snapshot is dropped and the next load_json rebuilds it
+    try:
+        os.remove(path + SNAPSHOT_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+
+def write_snapshot(path, stat, raw, data):
+    """Store `data` next to `path`, tagged with the JSON file it was parsed from.
+
+    The snapshot is marshal data with repeated strings shared, which loads
+    about three times faster than json.loads for typical history files.
+    """
+    header = marshal.dumps((SNAPSHOT_VERSION, SNAPSHOT_PYTHON, stat.st_mtime_ns,
+                            stat.st_size, zlib.crc32(raw)))
+    body = marshal.dumps(share_strings(data, {}))
+    temp_path = path + SNAPSHOT_SUFFIX + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(struct.pack("<I", len(header)) + header + body)
+    # A lost snapshot only costs one slow load, so no fsync here
+    os.replace(temp_path, path + SNAPSHOT_SUFFIX)
+
+
+def share_strings(value, seen):
+    # Equal strings become one object, which marshal then stores only once
+    if isinstance(value, str):
+        return seen.setdefault(value, value)
+    if isinstance(value, dict):
+        return {seen.setdefault(k, k) if isinstance(k, str) else k: share_strings(v, seen)
+                for k, v in value.items()}
+    if isinstance(value, list):
+        return [share_strings(item, seen) for item in value]
+    return value
+
+
+def rebuild_snapshot(path):
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    write_snapshot(path, stat, raw, json.loads(raw.decode("utf-8")))
+
+
+def load_snapshot(path, stat):
+    """Data from the snapshot of `path` if it matches the file exactly, else None"""
+    try:
+        with open(path + SNAPSHOT_SUFFIX, "rb") as f:
+            blob = f.read()
+        (header_size,) = struct.unpack_from("<I", blob)
+        header = marshal.loads(blob[4:4 + header_size])
+        if header[:4] != (SNAPSHOT_VERSION, SNAPSHOT_PYTHON, stat.st_mtime_ns, stat.st_size):
+            return None
+        with open(path, "rb") as f:
+            if zlib.crc32(f.read()) != header[4]:
+                return None
+        # Decoding only creates acyclic containers, so skip the collector passes
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return marshal.loads(memoryview(blob)[4 + header_size:])
+        finally:
+            if collecting:
+                gc.enable()
+    except (OSError, EOFError, ValueError, TypeError, IndexError, struct.error):
+        return None
+
+
+executor = PersistenceExecutor()
+atexit.register(executor.flush)
+
+
+def save_json(path, data, **dump_kwargs):
+    """Queue `data` to be written to `path` as JSON on the shared writer thread"""
+    executor.save_json(path, data, **dump_kwargs)
+
+
+def load_json(path):
+    """Parse a JSON data file, using its binary snapshot when that is fresh.
+
+    A missing or stale snapshot is rebuilt on the writer thread. Raises
+    OSError or ValueError just like reading the file with json.load would.
+    """
+    stat = os.stat(path)
+    data = load_snapshot(path, stat)
+    if data is not None:
+        return data
+    with open(path, "rb") as f:
+        data = json.loads(f.read().decode("utf-8"))
+    executor.rebuild_snapshot(path)
+    return data
+
+
+def flush_writes(timeout=None):
+    return executor.flush(timeout)
@@ -0,0 +1,151 @@
+import heapq
+from datetime import datetime, timedelta
+
+
+# Assumed length of a SepTempo event that has no explicit duration
+DEFAULT_EVENT_MINUTES = 60
+
+
+def merge_busy_intervals(busy):
+    """Sort and merge overlapping (start, end) datetime pairs"""
+    merged = []
+    for start, end in sorted(busy):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_intervals(window_start, window_end, busy):
+    """Complement of the merged busy intervals inside one planning window"""
+    free = []
+    cursor = window_start
+    for start, end in merge_busy_intervals(busy):
+        if end <= cursor:
+            continue
+        if start >= window_end:
+            break
+        if start > cursor:
+            free.append((cursor, start))
+        cursor = max(cursor, end)
+    if cursor < window_end:
+        free.append((cursor, window_end))
+    return free
+
+
+def iter_pomodoro_slots(free, work_duration, short_break, long_break,
+                        sessions_until_long_break=4):
+    """Lazily yield (start, end, session_number) work slots packed into free time.
+
+    A break follows every work slot; the long break replaces the short one every
+    `sessions_until_long_break` sessions. When a free interval runs out the break
+    is absorbed by the busy event that follows it.
+    """
+    work = timedelta(minutes=work_duration)
+    short = timedelta(minutes=short_break)
+    long_ = timedelta(minutes=long_break)
+    session = 0
+
+    for start, end in free:
+        cursor = start
+        while cursor + work <= end:
+            session += 1
+            yield cursor, cursor + work, session
+            if sessions_until_long_break and session % sessions_until_long_break == 0:
+                cursor += work + long_
+            else:
+                cursor += work + short
+
+
+def plan_study_tasks(tasks, windows, busy, work_duration=25, short_break=5,
+                     long_break=15, sessions_until_long_break=4):
+    """Greedily pack tasks into Pomodoro slots around busy events.
+
+    `tasks` are dicts with "title", "minutes", "priority" (higher first) and an
+    optional "deadline" datetime. `windows` are the (start, end) datetimes the
+    user is available in, and `busy` the (start, end) datetimes already taken.
+    Each slot goes to the pending task with the earliest deadline (ties broken
+    by priority), which is optimal for meeting deadlines with unit-sized jobs.
+    Runs in O((tasks + slots) log tasks).
+    """
+    busy = merge_busy_intervals(busy)
+    heap = []
+    for index, task in enumerate(tasks):
+        minutes = max(1, int(task.get("minutes", work_duration)))
+        deadline = task.get("deadline") or datetime.max
+        heapq.heappush(heap, (deadline, -task.get("priority", 3), index, minutes))
+
+    sessions = []
+    late = []
+    for window_start, window_end in sorted(windows):
+        if not heap:
+            break
+        free = free_intervals(window_start, window_end, busy)
+        for slot_start, slot_end, session in iter_pomodoro_slots(
+                free, work_duration, short_break, long_break, sessions_until_long_break):
+            # Tasks whose deadline has already passed can no longer be planned
+            while heap and heap[0][0] < slot_end:
+                late.append(tasks[heapq.heappop(heap)[2]])
+            if not heap:
+                break
+
+            deadline, neg_priority, index, remaining = heapq.heappop(heap)
+            sessions.append({
+                "start": slot_start,
+                "end": slot_end,
+                "session": session,
+                "task": tasks[index],
+            })
+            remaining -= work_duration
+            if remaining > 0:
+                heapq.heappush(heap, (deadline, neg_priority, index, remaining))
+
+    unscheduled = late + [tasks[entry[2]] for entry in sorted(heap)]
+    return {"sessions": sessions, "unscheduled": unscheduled}
+
+
+def parse_task_line(line, now=None):
+    """Parse 'title | minutes | priority | deadline' into a task dict.
+
+    Only the title is required. The deadline accepts 'yyyy-mm-dd HH:MM',
+    'yyyy-mm-dd' (end of that day) or 'HH:MM' (today).
+    """
+    now = now or datetime.now()
+    parts = [part.strip() for part in line.split("|")]
+    if not parts[0]:
+        return None
+
+    task = {"title": parts[0], "minutes": 25, "priority": 3, "deadline": None}
+    if len(parts) > 1 and parts[1].isdigit():
+        task["minutes"] = int(parts[1])
+    if len(parts) > 2 and parts[2].isdigit():
+        task["priority"] = int(parts[2])
+    if len(parts) > 3 and parts[3]:
+        for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d", "%H:%M"):
+            try:
+                deadline = datetime.strptime(parts[3], fmt)
+            except ValueError:
+                continue
+            if fmt == "%Y-%m-%d":
+                deadline = deadline.replace(hour=23, minute=59)
+            elif fmt == "%H:%M":
+                deadline = now.replace(hour=deadline.hour, minute=deadline.minute,
+                                       second=0, microsecond=0)
+            task["deadline"] = deadline
+            break
+    return task
+
+
+def busy_from_events(events):
+    """Turn SepTempo event dicts (with "date" and "time") into busy intervals"""
+    busy = []
+    for event in events:
+        try:
+            start = datetime.strptime(f"{event['date']} {event['time']}", "%Y-%m-%d %H:%M")
+            minutes = int(event.get("duration") or DEFAULT_EVENT_MINUTES)
+        except (KeyError, TypeError, ValueError):
+            continue
+        busy.append((start, start + timedelta(minutes=minutes)))
+    return busy
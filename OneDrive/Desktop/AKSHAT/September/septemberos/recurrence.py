@@ -0,0 +1,149 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+
+def parse_date(value):
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def add_months(year, month, months):
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+class RecurrenceRule:
+    """RRULE-style recurrence: daily, weekly on chosen weekdays or monthly.
+
+    Occurrences are never materialized up front; `occurrences` jumps straight
+    to the requested window, so the cost is proportional to the window size
+    and not to how long ago the series started.
+    """
+
+    def __init__(self, start, freq, interval=1, weekdays=None, until=None,
+                 count=None, exdates=()):
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unsupported frequency: {freq}")
+        self.start = parse_date(start)
+        self.freq = freq
+        self.interval = max(1, int(interval))
+        self.weekdays = sorted(set(weekdays)) if weekdays else [self.start.weekday()]
+        self.until = parse_date(until) if until else None
+        self.count = count
+        self.exdates = {parse_date(d) for d in exdates}
+        self._last = None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["start_date"], data["freq"], data.get("interval", 1),
+                   data.get("weekdays"), data.get("until"), data.get("count"),
+                   data.get("exdates", ()))
+
+    def to_dict(self):
+        return {
+            "start_date": self.start.isoformat(),
+            "freq": self.freq,
+            "interval": self.interval,
+            "weekdays": self.weekdays,
+            "until": self.until.isoformat() if self.until else None,
+            "count": self.count,
+            "exdates": sorted(d.isoformat() for d in self.exdates),
+        }
+
+    def last_date(self):
+        """Last date the series can produce, or None if it never ends"""
+        if self._last is None and self.count:
+            # COUNT includes excluded dates, as in RFC 5545
+            last = self.start
+            for index, day in enumerate(self._iter_from(self.start, self.until)):
+                last = day
+                if index + 1 >= self.count:
+                    break
+            self._last = last
+        if self._last is not None:
+            return min(self._last, self.until) if self.until else self._last
+        return self.until
+
+    def occurrences(self, window_start, window_end):
+        """Yield occurrence dates with window_start <= date <= window_end"""
+        window_start = max(parse_date(window_start), self.start)
+        window_end = parse_date(window_end)
+        last = self.last_date()
+        if last is not None:
+            window_end = min(window_end, last)
+        if window_start > window_end:
+            return
+
+        for day in self._iter_from(window_start, window_end):
+            if day not in self.exdates:
+                yield day
+
+    def _iter_from(self, first, last):
+        if self.freq == "daily":
+            offset = (first - self.start).days
+            step = -(-offset // self.interval) * self.interval
+            day = self.start + timedelta(days=step)
+            while last is None or day <= last:
+                yield day
+                day += timedelta(days=self.interval)
+
+        elif self.freq == "weekly":
+            week_zero = self.start - timedelta(days=self.start.weekday())
+            weeks = (first - week_zero).days // 7
+            weeks -= weeks % self.interval
+            week = week_zero + timedelta(weeks=weeks)
+            while last is None or week <= last:
+                for weekday in self.weekdays:
+                    day = week + timedelta(days=weekday)
+                    if day < first or day < self.start:
+                        continue
+                    if last is not None and day > last:
+                        return
+                    yield day
+                week += timedelta(weeks=self.interval)
+
+        else:
+            months = (first.year - self.start.year) * 12 + first.month - self.start.month
+            months = max(0, months - months % self.interval)
+            while True:
+                year, month = add_months(self.start.year, self.start.month, months)
+                if last is not None and (year, month) > (last.year, last.month):
+                    return
+                # Months without this day (e.g. the 31st) are skipped
+                if self.start.day <= calendar.monthrange(year, month)[1]:
+                    day = date(year, month, self.start.day)
+                    if last is not None and day > last:
+                        return
+                    if day >= first:
+                        yield day
+                months += self.interval
+
+
+class OccurrenceCache:
+    """Expanded occurrences per (series, version, window); bounded LRU dict"""
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self.entries = {}
+
+    def get(self, series_id, version, rule, window_start, window_end):
+        key = (series_id, version, window_start, window_end)
+        dates = self.entries.pop(key, None)
+        if dates is None:
+            if len(self.entries) >= self.max_entries:
+                self.entries.pop(next(iter(self.entries)))
+            dates = [d.isoformat() for d in rule.occurrences(window_start, window_end)]
+        # Re-inserting keeps the dict in least- to most-recently used order
+        self.entries[key] = dates
+        return dates
+
+    def invalidate(self, series_id=None):
+        if series_id is None:
+            self.entries.clear()
+            return
+        for key in [key for key in self.entries if key[0] == series_id]:
+            del self.entries[key]
@@ -0,0 +1,62 @@
+import heapq
+from datetime import datetime, timedelta
+
+
+# Longest lead time offered in SepTempo; the load window is padded by it
+MAX_LEAD_MINUTES = 24 * 60
+
+
+def event_start(event):
+    return datetime.strptime(f"{event['date']} {event['time']}", "%Y-%m-%d %H:%M")
+
+
+class ReminderQueue:
+    """Min-heap of upcoming reminder times for the next few days.
+
+    Only occurrences inside the horizon are held in memory; the owner asks for
+    a refill once `refill_at` passes. The GUI arms a single-shot timer for
+    `next_wakeup()`, so an idle calendar costs nothing between reminders no
+    matter how many future events exist.
+    """
+
+    def __init__(self, store, horizon_days=3, now=None):
+        self.store = store
+        self.horizon = timedelta(days=horizon_days)
+        self.heap = []
+        self.fired_until = now or datetime.now()
+        self.refill_at = self.fired_until
+        self.refill(self.fired_until)
+
+    def refill(self, now=None):
+        now = now or datetime.now()
+        load_until = now + self.horizon + timedelta(minutes=MAX_LEAD_MINUTES)
+        self.heap = []
+        for event in self.store.occurrences_between(now.strftime("%Y-%m-%d"),
+                                                    load_until.strftime("%Y-%m-%d")):
+            lead = event.get("remind_minutes")
+            if lead is None:
+                continue
+            try:
+                fire_at = event_start(event) - timedelta(minutes=lead)
+            except (KeyError, ValueError):
+                continue
+            # Never repeat a reminder that already fired before this refill
+            if fire_at > self.fired_until:
+                self.heap.append((fire_at, len(self.heap), event))
+        heapq.heapify(self.heap)
+        self.refill_at = now + self.horizon
+
+    def next_wakeup(self):
+        if self.heap and self.heap[0][0] < self.refill_at:
+            return self.heap[0][0]
+        return self.refill_at
+
+    def pop_due(self, now=None):
+        now = now or datetime.now()
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            due.append(heapq.heappop(self.heap)[2])
+        self.fired_until = max(self.fired_until, now)
+        if now >= self.refill_at:
+            self.refill(now)
+        return due
@@ -1,37 +1,361 @@
-import json
-import os
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QCalendarWidget, QTextEdit, QLineEdit, QTimeEdit, QComboBox,
                              QGroupBox, QGridLayout, QListWidget, QListWidgetItem, QGraphicsDropShadowEffect,
-                             QProgressBar)
-from PyQt5.QtCore import Qt, QTimer, QDate, QTime, QDateTime, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QPixmap, QPainter, QTextCharFormat
+                             QProgressBar, QSystemTrayIcon, QSpinBox, QMessageBox, QListView,
+                             QFileDialog, QProgressDialog)
+from PyQt5.QtCore import (Qt, QTimer, QDate, QTime, QDateTime, pyqtSignal,
+                          QAbstractListModel, QModelIndex, QThread, QSize)
+from PyQt5.QtGui import QFont, QColor, QPixmap, QPainter, QTextCharFormat, QIcon, QBrush
 import calendar
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import random
+from bisect import bisect_right
+from .eventstore import EventStore, month_range
+from .recurrence import RecurrenceRule, add_months
+from .reminders import ReminderQueue
+from .intervals import find_free_slot
+from .ics import import_ics, export_ics
+from .suggestions import mine_suggestions
+from .tracing import traced
+from .metrics import measured
+
+
+REPEAT_OPTIONS = {
+    "🔂 No repeat": None,
+    "📆 Daily": "daily",
+    "🗓️ Weekly": "weekly",
+    "🌙 Monthly": "monthly",
+}
+
+REMINDER_OPTIONS = {
+    "🔕 No reminder": None,
+    "⏰ At start time": 0,
+    "⏰ 5 min before": 5,
+    "⏰ 15 min before": 15,
+    "⏰ 30 min before": 30,
+    "⏰ 1 hour before": 60,
+    "⏰ 1 day before": 24 * 60,
+}
+
+
+# Color code by category
+CATEGORY_COLORS = {
+    "📚 Study": (173, 216, 230),
+    "💼 Work": (255, 182, 193),
+    "🎯 Personal": (221, 160, 221),
+    "🎉 Social": (255, 218, 185),
+    "🏃 Exercise": (144, 238, 144),
+    "🍽️ Food": (255, 228, 196),
+    "🎨 Creative": (255, 160, 122)
+}
+DEFAULT_CATEGORY_COLOR = (245, 222, 179)
+STICKER_ROW_COLOR = (255, 255, 224)
+
+_brush_cache = {}
+
+
+def category_brush(category):
+    # Brushes are created once per category and shared by every view
+    brush = _brush_cache.get(category)
+    if brush is None:
+        brush = QBrush(QColor(*CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)))
+        _brush_cache[category] = brush
+    return brush
+
+
+class DayEventsModel(QAbstractListModel):
+    # Events of the selected day, kept sorted by time, plus an optional sticker row
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.events = []
+        self.sort_keys = []
+        self.stickers = []
+        self.sticker_brush = QBrush(QColor(*STICKER_ROW_COLOR))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.events) + (1 if self.stickers else 0)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+
+        if row == len(self.events):
+            if role == Qt.DisplayRole:
+                return f"🎨 Stickers: {' '.join(self.stickers)}"
+            if role == Qt.BackgroundRole:
+                return self.sticker_brush
+            return None
+
+        event = self.events[row]
+        if role == Qt.DisplayRole:
+            repeat_icon = " 🔁" if event.get("series_id") else ""
+            return f"{event['time']} - {event['category']} {event['title']}{repeat_icon}"
+        if role == Qt.BackgroundRole:
+            return category_brush(event["category"])
+        if role == Qt.UserRole:
+            return event
+        return None
+
+    def set_day(self, events, stickers):
+        # `events` arrive ordered by time from the event store
+        self.beginResetModel()
+        self.events = list(events)
+        self.sort_keys = [event["time"] for event in self.events]
+        self.stickers = list(stickers)
+        self.endResetModel()
+
+    def insert_event(self, event):
+        row = bisect_right(self.sort_keys, event["time"])
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.events.insert(row, event)
+        self.sort_keys.insert(row, event["time"])
+        self.endInsertRows()
+
+    def set_stickers(self, stickers):
+        had_row = bool(self.stickers)
+        row = len(self.events)
+        if had_row and stickers:
+            self.stickers = list(stickers)
+            self.dataChanged.emit(self.index(row), self.index(row))
+        elif stickers:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.stickers = list(stickers)
+            self.endInsertRows()
+        elif had_row:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.stickers = []
+            self.endRemoveRows()
+
+
+class AgendaModel(QAbstractListModel):
+    # Multi-month agenda fetched one month at a time as the view scrolls
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.rows = []  # Compact (date, time, category, title, recurring) tuples
+        self.start_month = self.next_month = None
+        self.end_month = None
+
+    def set_range(self, year, month, months):
+        self.beginResetModel()
+        self.rows = []
+        self.start_month = self.next_month = (year, month)
+        self.end_month = add_months(year, month, months - 1)
+        self.endResetModel()
+
+    def covers(self, year, month):
+        return self.start_month is not None and self.start_month <= (year, month) <= self.end_month
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.next_month is not None \
+            and self.next_month <= self.end_month
+
+    @traced()
+    def fetchMore(self, parent=QModelIndex()):
+        # Skip empty months so a single fetch always yields rows when any remain
+        batch = []
+        while not batch and self.canFetchMore(parent):
+            start_key, end_key = month_range(*self.next_month)
+            batch = [(event["date"], event["time"], event["category"], event["title"],
+                      bool(event.get("series_id")))
+                     for event in self.store.occurrences_between(start_key, end_key)]
+            self.next_month = add_months(*self.next_month, 1)
+        if batch:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+            self.rows.extend(batch)
+            self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        date_key, time, category, title, recurring = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            day = QDate.fromString(date_key, "yyyy-MM-dd").toString("ddd dd MMM yyyy")
+            return f"{day} · {time} - {category} {title}{' 🔁' if recurring else ''}"
+        if role == Qt.BackgroundRole:
+            return category_brush(category)
+        if role == Qt.UserRole:
+            return date_key
+        return None
+
+
+# Heatmap shades from empty to busiest, and the counts at which each starts
+HEATMAP_COLORS = [(255, 248, 220), (250, 214, 165), (244, 164, 96), (210, 105, 30), (139, 69, 19)]
+HEATMAP_LEVELS = [0, 1, 2, 4, 7]
+
+
+class YearHeatmap(QWidget):
+    # Contribution-graph style year view rendered into cached per-year pixmaps
+    date_clicked = pyqtSignal(QDate)
+
+    CELL = 11
+    GAP = 2
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.year = date.today().year
+        self.pixmaps = {}  # year -> QPixmap
+        self.counts = {}   # year -> {date_key: count}
+        self.dirty = {}    # year -> date keys to repaint
+        self.colors = [QColor(*rgb) for rgb in HEATMAP_COLORS]
+        self.setMinimumSize(self.sizeHint())
+
+    def sizeHint(self):
+        step = self.CELL + self.GAP
+        return QSize(54 * step, 7 * step)
+
+    def cell_rect(self, day):
+        first = date(day.year, 1, 1)
+        column = ((day - first).days + first.weekday()) // 7
+        step = self.CELL + self.GAP
+        return column * step, day.weekday() * step, self.CELL, self.CELL
+
+    def color_for(self, count):
+        level = 0
+        for index, threshold in enumerate(HEATMAP_LEVELS):
+            if count >= threshold:
+                level = index
+        return self.colors[level]
+
+    def set_year(self, year):
+        self.year = year
+        self.update()
+
+    def mark_dirty(self, date_key):
+        year = int(date_key[:4])
+        if year in self.pixmaps:
+            self.dirty.setdefault(year, set()).add(date_key)
+            if year == self.year:
+                self.update()
+
+    def invalidate(self):
+        self.pixmaps.clear()
+        self.counts.clear()
+        self.dirty.clear()
+        self.update()
+
+    def render_year(self, year):
+        counts = self.store.year_counts(year)
+        pixmap = QPixmap(self.sizeHint())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        day = date(year, 1, 1)
+        while day.year == year:
+            painter.fillRect(*self.cell_rect(day), self.color_for(counts.get(day.isoformat(), 0)))
+            day += timedelta(days=1)
+        painter.end()
+        self.counts[year] = counts
+        self.pixmaps[year] = pixmap
+
+    def repaint_dirty(self, year):
+        # Only the cells whose counts changed are redrawn onto the cached pixmap
+        painter = QPainter(self.pixmaps[year])
+        for date_key in self.dirty.pop(year, ()):
+            count = self.store.day_count(date_key)
+            self.counts[year][date_key] = count
+            day = date(int(date_key[:4]), int(date_key[5:7]), int(date_key[8:10]))
+            painter.fillRect(*self.cell_rect(day), self.color_for(count))
+        painter.end()
+
+    @traced()
+    @measured("render.heatmap")
+    def paintEvent(self, event):
+        if self.year not in self.pixmaps:
+            self.render_year(self.year)
+        elif self.dirty.get(self.year):
+            self.repaint_dirty(self.year)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.pixmaps[self.year])
+        painter.end()
+
+    def mousePressEvent(self, event):
+        step = self.CELL + self.GAP
+        column, row = event.x() // step, event.y() // step
+        first = date(self.year, 1, 1)
+        offset = column * 7 + row - first.weekday()
+        day = first + timedelta(days=offset)
+        if 0 <= offset and day.year == self.year:
+            self.date_clicked.emit(QDate(day.year, day.month, day.day))
+
+
+class IcsTransferThread(QThread):
+    # Streams an .ics import or export on its own SQLite connection
+    progress = pyqtSignal(int)
+    # Events transferred and an error message, empty on success
+    transfer_finished = pyqtSignal(int, str)
+
+    def __init__(self, mode, path, db_path):
+        super().__init__()
+        self.mode = mode
+        self.path = path
+        self.db_path = db_path
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        store = EventStore(self.db_path, legacy_json=None)
+        count = 0
+        error = ""
+        try:
+            if self.mode == "import":
+                count = import_ics(
+                    store, self.path,
+                    progress=lambda done, total: self.progress.emit(int(done * 100 / max(total, 1))),
+                    should_cancel=lambda: self.cancelled)
+            else:
+                count = export_ics(store, self.path, progress=self.progress.emit,
+                                   should_cancel=lambda: self.cancelled)
+        except (OSError, ValueError) as e:
+            error = str(e)
+        finally:
+            store.close()
+        self.transfer_finished.emit(count, error)
+
+
+class ReminderToast(QLabel):
+    # In-app fallback when the desktop has no notification area
+    def __init__(self, parent, text):
+        super().__init__(text, parent)
+        self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: #FFF8DC;
+                color: #8B4513;
+                border: 2px solid #CD853F;
+                border-radius: 10px;
+                padding: 12px;
+                font-weight: bold;
+            }
+        """)
+        self.adjustSize()
+        corner = parent.window().geometry().bottomRight()
+        self.move(corner.x() - self.width() - 20, corner.y() - self.height() - 20)
+        QTimer.singleShot(8000, self.deleteLater)
 
 
 class SepTempo(QWidget):
     def __init__(self):
         super().__init__()
-        self.events_file = "calendar_events.json"
-        self.events = self.load_events()
+        self.store = EventStore()
+        self.styled_dates = set()  # Dates on the visible page carrying a sticker format
+        self.dirty_dates = set()
+        self.sticker_format = QTextCharFormat()
+        self.sticker_format.setBackground(QColor(255, 248, 220))
+        self.sticker_format.setForeground(QColor(139, 69, 19))
         self.seasonal_stickers = ["🍂", "🍁", "🍃", "🌰", "🎃", "🌾", "🍄", "☕"]
         self.setup_ui()
         self.setup_lo_fi_sync()
-
-    def load_events(self):
-        if os.path.exists(self.events_file):
-            try:
-                with open(self.events_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-
-    def save_events(self):
-        with open(self.events_file, 'w') as f:
-            json.dump(self.events, f, indent=2, default=str)
+        self.setup_reminders()
 
     def setup_ui(self):
         main_layout = QHBoxLayout()
@@ -53,6 +377,8 @@ class SepTempo(QWidget):
         self.calendar = QCalendarWidget()
         self.calendar.setGridVisible(True)
         self.calendar.clicked.connect(self.date_selected)
+        self.calendar.currentPageChanged.connect(self.update_calendar_stickers)
+        self.calendar.currentPageChanged.connect(self.agenda_page_changed)
 
         # Style the calendar
         self.calendar.setStyleSheet("""
@@ -95,12 +421,86 @@ class SepTempo(QWidget):
         sticker_layout.addWidget(add_sticker_btn)
 
         calendar_layout.addLayout(sticker_layout)
+
+        ics_layout = QHBoxLayout()
+        import_ics_btn = QPushButton("📥 Import .ics")
+        import_ics_btn.clicked.connect(self.import_calendar)
+        ics_layout.addWidget(import_ics_btn)
+
+        export_ics_btn = QPushButton("📤 Export .ics")
+        export_ics_btn.clicked.connect(self.export_calendar)
+        ics_layout.addWidget(export_ics_btn)
+        calendar_layout.addLayout(ics_layout)
         calendar_group.setLayout(calendar_layout)
         left_panel.addWidget(calendar_group)
 
+        # Multi-month agenda starting at the month shown in the calendar
+        agenda_group = QGroupBox("🗂️ Agenda")
+        agenda_layout = QVBoxLayout()
+
+        agenda_range_layout = QHBoxLayout()
+        agenda_range_layout.addWidget(QLabel("Months to show:"))
+        self.agenda_months = QSpinBox()
+        self.agenda_months.setRange(1, 120)
+        self.agenda_months.setValue(3)
+        self.agenda_months.valueChanged.connect(self.refresh_agenda)
+        agenda_range_layout.addWidget(self.agenda_months)
+        agenda_layout.addLayout(agenda_range_layout)
+
+        self.agenda_model = AgendaModel(self.store, self)
+        self.agenda_view = QListView()
+        self.agenda_view.setModel(self.agenda_model)
+        self.agenda_view.setUniformItemSizes(True)
+        self.agenda_view.setLayoutMode(QListView.Batched)
+        self.agenda_view.clicked.connect(self.agenda_item_clicked)
+        agenda_layout.addWidget(self.agenda_view)
+
+        agenda_group.setLayout(agenda_layout)
+        left_panel.addWidget(agenda_group)
+
+        heatmap_group = QGroupBox("🔥 Year at a Glance")
+        heatmap_layout = QVBoxLayout()
+
+        heatmap_nav = QHBoxLayout()
+        prev_year_btn = QPushButton("◀")
+        prev_year_btn.clicked.connect(lambda: self.show_heatmap_year(self.heatmap.year - 1))
+        heatmap_nav.addWidget(prev_year_btn)
+        self.heatmap_year_label = QLabel()
+        self.heatmap_year_label.setAlignment(Qt.AlignCenter)
+        heatmap_nav.addWidget(self.heatmap_year_label)
+        next_year_btn = QPushButton("▶")
+        next_year_btn.clicked.connect(lambda: self.show_heatmap_year(self.heatmap.year + 1))
+        heatmap_nav.addWidget(next_year_btn)
+        heatmap_layout.addLayout(heatmap_nav)
+
+        self.heatmap = YearHeatmap(self.store)
+        self.heatmap.date_clicked.connect(self.jump_to_date)
+        heatmap_layout.addWidget(self.heatmap)
+
+        heatmap_group.setLayout(heatmap_layout)
+        left_panel.addWidget(heatmap_group)
+
         # Right Panel - Event Management
         right_panel = QVBoxLayout()
 
+        # Event search
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search events by title, description or category...")
+        self.search_input.textChanged.connect(self.schedule_event_search)
+        right_panel.addWidget(self.search_input)
+
+        self.search_results = QListWidget()
+        self.search_results.setMaximumHeight(100)
+        self.search_results.itemClicked.connect(self.search_result_clicked)
+        self.search_results.hide()
+        right_panel.addWidget(self.search_results)
+
+        # Wait for a short typing pause before querying
+        self.search_timer = QTimer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.run_event_search)
+
         # Selected Date Display
         self.selected_date_label = QLabel(
             f"Selected: {datetime.now().strftime('%B %d, %Y')}")
@@ -136,9 +536,26 @@ class SepTempo(QWidget):
             "Optional event description...")
         event_layout.addWidget(self.event_description, 3, 1)
 
+        event_layout.addWidget(QLabel("Repeat:"), 4, 0)
+        self.event_repeat = QComboBox()
+        self.event_repeat.addItems(list(REPEAT_OPTIONS))
+        event_layout.addWidget(self.event_repeat, 4, 1)
+
+        event_layout.addWidget(QLabel("Reminder:"), 5, 0)
+        self.event_reminder = QComboBox()
+        self.event_reminder.addItems(list(REMINDER_OPTIONS))
+        event_layout.addWidget(self.event_reminder, 5, 1)
+
+        event_layout.addWidget(QLabel("Duration (min):"), 6, 0)
+        self.event_duration = QSpinBox()
+        self.event_duration.setRange(5, 24 * 60)
+        self.event_duration.setSingleStep(5)
+        self.event_duration.setValue(60)
+        event_layout.addWidget(self.event_duration, 6, 1)
+
         create_event_btn = QPushButton("🌟 Create Event")
         create_event_btn.clicked.connect(self.create_event)
-        event_layout.addWidget(create_event_btn, 4, 0, 1, 2)
+        event_layout.addWidget(create_event_btn, 7, 0, 1, 2)
 
         event_group.setLayout(event_layout)
         right_panel.addWidget(event_group)
@@ -147,10 +564,35 @@ class SepTempo(QWidget):
         today_group = QGroupBox("📋 Today's Schedule")
         today_layout = QVBoxLayout()
 
-        self.today_events_list = QListWidget()
+        self.day_model = DayEventsModel(self)
+        self.today_events_list = QListView()
+        self.today_events_list.setModel(self.day_model)
+        self.today_events_list.setUniformItemSizes(True)
         self.today_events_list.setMaximumHeight(150)
         today_layout.addWidget(self.today_events_list)
 
+        skip_occurrence_btn = QPushButton("🚫 Skip Selected Occurrence")
+        skip_occurrence_btn.clicked.connect(self.skip_selected_occurrence)
+        today_layout.addWidget(skip_occurrence_btn)
+
+        free_slot_layout = QHBoxLayout()
+        self.free_slot_length = QComboBox()
+        self.free_slot_length.addItems(["25 min", "50 min"])
+        free_slot_layout.addWidget(self.free_slot_length)
+
+        self.free_slot_scope = QComboBox()
+        self.free_slot_scope.addItems(["Today", "This week"])
+        free_slot_layout.addWidget(self.free_slot_scope)
+
+        find_slot_btn = QPushButton("🔍 Find Free Slot")
+        find_slot_btn.clicked.connect(self.find_next_free_slot)
+        free_slot_layout.addWidget(find_slot_btn)
+        today_layout.addLayout(free_slot_layout)
+
+        self.free_slot_label = QLabel("")
+        self.free_slot_label.setStyleSheet("color: #A0522D; font-style: italic;")
+        today_layout.addWidget(self.free_slot_label)
+
         today_group.setLayout(today_layout)
         right_panel.addWidget(today_group)
 
@@ -206,6 +648,8 @@ class SepTempo(QWidget):
         self.current_date = QDate.currentDate()
         self.update_calendar_stickers()
         self.update_today_events()
+        self.refresh_agenda()
+        self.show_heatmap_year(self.calendar.yearShown())
         self.generate_smart_suggestions()
 
     def setup_lo_fi_sync(self):
@@ -219,6 +663,55 @@ class SepTempo(QWidget):
         self.productivity_timer.timeout.connect(self.update_productivity_flow)
         self.productivity_timer.start(5000)  # Update every 5 seconds
 
+    def suspend(self):
+        """Called by the main window while this tab is hidden or minimized"""
+        self.lofi_timer.stop()
+        self.productivity_timer.stop()
+
+    def resume(self):
+        # Refresh right away instead of showing stale values until the next tick
+        self.update_lofi_sync()
+        self.update_productivity_flow()
+        self.lofi_timer.start()
+        self.productivity_timer.start()
+
+    def setup_reminders(self):
+        self.reminders = ReminderQueue(self.store)
+        self.tray_icon = None
+        # One single-shot timer armed for the next reminder; nothing polls
+        self.reminder_timer = QTimer()
+        self.reminder_timer.setSingleShot(True)
+        self.reminder_timer.timeout.connect(self.fire_due_reminders)
+        self.schedule_next_reminder()
+
+    def schedule_next_reminder(self):
+        delay = (self.reminders.next_wakeup() - datetime.now()).total_seconds()
+        self.reminder_timer.start(max(0, int(delay * 1000)))
+
+    def fire_due_reminders(self):
+        for event in self.reminders.pop_due():
+            self.show_reminder(event)
+        self.schedule_next_reminder()
+
+    def show_reminder(self, event):
+        title = f"⏰ {event['title']}"
+        message = f"{event['time']} - {event['category']}"
+
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            if self.tray_icon is None:
+                icon = QPixmap(32, 32)
+                icon.fill(Qt.transparent)
+                painter = QPainter(icon)
+                painter.setFont(QFont("Arial", 20))
+                painter.drawText(icon.rect(), Qt.AlignCenter, "🍂")
+                painter.end()
+                self.tray_icon = QSystemTrayIcon(self)
+                self.tray_icon.setIcon(QIcon(icon))
+                self.tray_icon.show()
+            self.tray_icon.showMessage(title, message)
+        else:
+            ReminderToast(self, f"{title}\n{message}").show()
+
     def update_lofi_sync(self):
         lofi_messages = [
             "🎧 Syncing with morning coffee vibes...",
@@ -262,26 +755,45 @@ class SepTempo(QWidget):
         date_key = self.current_date.toString("yyyy-MM-dd")
         sticker = self.sticker_combo.currentText()
 
-        if date_key not in self.events:
-            self.events[date_key] = {"events": [], "stickers": []}
-
-        if "stickers" not in self.events[date_key]:
-            self.events[date_key]["stickers"] = []
-
-        self.events[date_key]["stickers"].append(sticker)
-        self.save_events()
-        self.update_calendar_stickers()
-
-    def update_calendar_stickers(self):
-        # Apply stickers to calendar dates
-        format_with_sticker = QTextCharFormat()
-        format_with_sticker.setBackground(QColor(255, 248, 220))
-        format_with_sticker.setForeground(QColor(139, 69, 19))
-
-        for date_str, data in self.events.items():
-            if "stickers" in data and data["stickers"]:
-                date = QDate.fromString(date_str, "yyyy-MM-dd")
-                self.calendar.setDateTextFormat(date, format_with_sticker)
+        self.store.add_sticker(date_key, sticker)
+        self.mark_date_dirty(date_key)
+        self.day_model.set_stickers(self.day_model.stickers + [sticker])
+
+    def update_calendar_stickers(self, year=None, month=None):
+        # Restyle only the month page the calendar is showing
+        year = year or self.calendar.yearShown()
+        month = month or self.calendar.monthShown()
+
+        plain_format = QTextCharFormat()
+        for date_str in self.styled_dates:
+            self.calendar.setDateTextFormat(
+                QDate.fromString(date_str, "yyyy-MM-dd"), plain_format)
+
+        self.styled_dates = set(self.store.sticker_dates_between(*month_range(year, month)))
+        for date_str in self.styled_dates:
+            self.calendar.setDateTextFormat(
+                QDate.fromString(date_str, "yyyy-MM-dd"), self.sticker_format)
+        self.dirty_dates.clear()
+
+    def mark_date_dirty(self, date_key):
+        self.dirty_dates.add(date_key)
+        self.heatmap.mark_dirty(date_key)
+        self.restyle_dirty_dates()
+
+    def restyle_dirty_dates(self):
+        # Dates off the visible page are picked up on the next page change
+        start_key, end_key = month_range(self.calendar.yearShown(), self.calendar.monthShown())
+        for date_str in self.dirty_dates:
+            if not start_key <= date_str <= end_key:
+                continue
+            date = QDate.fromString(date_str, "yyyy-MM-dd")
+            if self.store.has_stickers(date_str):
+                self.styled_dates.add(date_str)
+                self.calendar.setDateTextFormat(date, self.sticker_format)
+            elif date_str in self.styled_dates:
+                self.styled_dates.discard(date_str)
+                self.calendar.setDateTextFormat(date, QTextCharFormat())
+        self.dirty_dates.clear()
 
     def create_event(self):
         if not self.event_title.text().strip():
@@ -294,62 +806,192 @@ class SepTempo(QWidget):
             "time": self.event_time.time().toString("hh:mm"),
             "category": self.event_category.currentText(),
             "description": self.event_description.toPlainText(),
-            "created": datetime.now().isoformat()
+            "created": datetime.now().isoformat(),
+            "remind_minutes": REMINDER_OPTIONS[self.event_reminder.currentText()],
+            "duration": self.event_duration.value()
         }
 
-        if date_key not in self.events:
-            self.events[date_key] = {"events": [], "stickers": []}
-
-        if "events" not in self.events[date_key]:
-            self.events[date_key]["events"] = []
-
-        self.events[date_key]["events"].append(event_data)
-        self.save_events()
+        start = datetime.strptime(f"{date_key} {event_data['time']}", "%Y-%m-%d %H:%M")
+        overlapping = self.store.conflicts(start, event_data["duration"])
+        if overlapping:
+            names = "\n".join(f"• {event['time']} {event['title']}" for event in overlapping[:5])
+            answer = QMessageBox.question(
+                self, "Schedule Conflict",
+                f"⚠️ This event overlaps:\n{names}\n\nCreate it anyway?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if answer != QMessageBox.Yes:
+                return
+
+        freq = REPEAT_OPTIONS[self.event_repeat.currentText()]
+        if freq:
+            series_id = self.store.add_series(event_data, RecurrenceRule(date_key, freq))
+            event_data.update({"id": None, "series_id": series_id})
+            self.heatmap.invalidate()  # A new series touches many days
+        else:
+            event_data["id"] = self.store.add_event(date_key, event_data)
+        event_data["date"] = date_key
 
         # Clear form
         self.event_title.clear()
         self.event_description.clear()
 
-        self.update_today_events()
-        self.update_calendar_stickers()
+        self.day_model.insert_event(event_data)
+        self.mark_date_dirty(date_key)
+        self.refresh_agenda()
+
+        if event_data["remind_minutes"] is not None:
+            self.reminders.refill()
+            self.schedule_next_reminder()
 
     def update_today_events(self):
-        self.today_events_list.clear()
         date_key = self.current_date.toString("yyyy-MM-dd")
+        # Already ordered by time, recurring occurrences included
+        self.day_model.set_day(self.store.occurrences_between(date_key, date_key),
+                               self.store.stickers_on(date_key))
+
+    def import_calendar(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Calendar", "", "iCalendar (*.ics)")
+        if path:
+            self.start_ics_transfer("import", path)
+
+    def export_calendar(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Calendar", "septempo.ics",
+                                              "iCalendar (*.ics)")
+        if path:
+            self.start_ics_transfer("export", path)
+
+    def start_ics_transfer(self, mode, path):
+        self.ics_thread = IcsTransferThread(mode, path, self.store.path)
+        self.ics_progress = QProgressDialog(
+            "📥 Importing events..." if mode == "import" else "📤 Exporting events...",
+            "Cancel", 0, 100 if mode == "import" else 0, self)
+        self.ics_progress.setWindowModality(Qt.WindowModal)
+        self.ics_progress.canceled.connect(self.ics_thread.cancel)
+        if mode == "import":
+            self.ics_thread.progress.connect(self.ics_progress.setValue)
+        else:
+            self.ics_thread.progress.connect(
+                lambda count: self.ics_progress.setLabelText(f"📤 Exported {count} events..."))
+        self.ics_thread.transfer_finished.connect(
+            lambda count, error: self.ics_transfer_finished(mode, count, error))
+        self.ics_thread.start()
+        self.ics_progress.show()
+
+    def ics_transfer_finished(self, mode, count, error=""):
+        self.ics_progress.close()
+        if mode == "import":
+            # The import wrote through another connection
+            self.store.invalidate_caches()
+            self.heatmap.invalidate()
+            self.update_calendar_stickers()
+            self.update_today_events()
+            self.refresh_agenda()
+            self.reminders.refill()
+            self.schedule_next_reminder()
+        verb = "Imported" if mode == "import" else "Exported"
+        if error:
+            self.lofi_status.setText(f"⚠️ Calendar {mode} failed after {count} events")
+            QMessageBox.warning(self, f"Calendar {mode.capitalize()}",
+                                f"⚠️ The calendar {mode} failed:\n{error}\n\n"
+                                f"{verb} {count} events before the error.")
+            return
+        self.lofi_status.setText(f"📅 {verb} {count} events")
+
+    @traced()
+    def refresh_agenda(self, *args):
+        self.agenda_model.set_range(self.calendar.yearShown(), self.calendar.monthShown(),
+                                    self.agenda_months.value())
+
+    def agenda_page_changed(self, year, month):
+        self.show_heatmap_year(year)
+        # Keep the agenda in place while paging inside the range it already shows
+        if not self.agenda_model.covers(year, month):
+            self.refresh_agenda()
+
+    def agenda_item_clicked(self, index):
+        self.jump_to_date(QDate.fromString(index.data(Qt.UserRole), "yyyy-MM-dd"))
+
+    def jump_to_date(self, date):
+        self.calendar.setSelectedDate(date)
+        self.date_selected(date)
+
+    def schedule_event_search(self, text):
+        self.search_timer.start()
+
+    @traced()
+    @measured("septempo.search")
+    def run_event_search(self):
+        text = self.search_input.text().strip()
+        self.search_results.clear()
+        if not text:
+            self.search_results.hide()
+            return
+
+        for event in self.store.search(text):
+            day = QDate.fromString(event["date"], "yyyy-MM-dd").toString("ddd dd MMM yyyy")
+            repeat_icon = " 🔁" if event.get("series_id") else ""
+            item = QListWidgetItem(
+                f"{day} · {event['time']} - {event['category']} {event['title']}{repeat_icon}")
+            item.setData(Qt.UserRole, event["date"])
+            item.setBackground(category_brush(event["category"]))
+            self.search_results.addItem(item)
+        if not self.search_results.count():
+            self.search_results.addItem("😔 No matching events")
+        self.search_results.show()
+
+    def search_result_clicked(self, item):
+        date_key = item.data(Qt.UserRole)
+        if date_key:
+            self.jump_to_date(QDate.fromString(date_key, "yyyy-MM-dd"))
+
+    def show_heatmap_year(self, year):
+        self.heatmap.set_year(year)
+        self.heatmap_year_label.setText(f"📆 {year}")
+
+    def find_next_free_slot(self):
+        minutes = int(self.free_slot_length.currentText().split()[0])
+        now = datetime.now().replace(second=0, microsecond=0)
+        days = 1 if self.free_slot_scope.currentText() == "Today" else 7 - now.weekday()
+
+        slot = None
+        for offset in range(days):
+            day = now + timedelta(days=offset)
+            window_start = now if offset == 0 else day.replace(hour=8, minute=0)
+            window_end = day.replace(hour=22, minute=0)
+            if window_start >= window_end:
+                continue
+            date_key = day.strftime("%Y-%m-%d")
+            slot = find_free_slot(self.store.interval_tree(date_key, date_key),
+                                  window_start, window_end, minutes)
+            if slot:
+                break
+
+        if not slot:
+            self.free_slot_label.setText(f"😔 No free {minutes}-minute slot found")
+            return
+
+        start, end = slot
+        self.free_slot_label.setText(
+            f"✨ Free: {start.strftime('%a %d %b, %H:%M')}–{end.strftime('%H:%M')}")
+        # Pre-fill the event form with the slot
+        date = QDate(start.year, start.month, start.day)
+        self.calendar.setSelectedDate(date)
+        self.date_selected(date)
+        self.event_time.setTime(QTime(start.hour, start.minute))
+        self.event_duration.setValue(minutes)
+
+    def skip_selected_occurrence(self):
+        event = self.today_events_list.currentIndex().data(Qt.UserRole)
+        if not event or not event.get("series_id"):
+            return
+
+        self.store.skip_occurrence(event["series_id"], event["date"])
+        self.update_today_events()
+        self.heatmap.mark_dirty(event["date"])
 
-        if date_key in self.events and "events" in self.events[date_key]:
-            events = self.events[date_key]["events"]
-            events.sort(key=lambda x: x["time"])  # Sort by time
-
-            for event in events:
-                event_text = f"{event['time']} - {event['category']} {event['title']}"
-                item = QListWidgetItem(event_text)
-
-                # Color code by category
-                category_colors = {
-                    "📚 Study": QColor(173, 216, 230),
-                    "💼 Work": QColor(255, 182, 193),
-                    "🎯 Personal": QColor(221, 160, 221),
-                    "🎉 Social": QColor(255, 218, 185),
-                    "🏃 Exercise": QColor(144, 238, 144),
-                    "🍽️ Food": QColor(255, 228, 196),
-                    "🎨 Creative": QColor(255, 160, 122)
-                }
-
-                color = category_colors.get(
-                    event['category'], QColor(245, 222, 179))
-                item.setBackground(color)
-
-                self.today_events_list.addItem(item)
-
-        # Add stickers display
-        if date_key in self.events and "stickers" in self.events[date_key]:
-            stickers = self.events[date_key]["stickers"]
-            if stickers:
-                sticker_text = f"🎨 Stickers: {' '.join(stickers)}"
-                sticker_item = QListWidgetItem(sticker_text)
-                sticker_item.setBackground(QColor(255, 255, 224))
-                self.today_events_list.addItem(sticker_item)
+        if event.get("remind_minutes") is not None:
+            self.reminders.refill()
+            self.schedule_next_reminder()
 
     def generate_smart_suggestions(self):
         current_hour = datetime.now().hour
@@ -396,15 +1038,18 @@ class SepTempo(QWidget):
         else:
             time_period = "evening"
 
-        suggestions = time_suggestions[time_period]
-        selected_suggestions = random.sample(suggestions, 2)
+        # Patterns mined from the user's history come first; generic tips fill the rest
+        selected_suggestions = mine_suggestions(self.store, datetime.now())
+        if len(selected_suggestions) < 2:
+            selected_suggestions += random.sample(time_suggestions[time_period],
+                                                  2 - len(selected_suggestions))
         day_suggestion = day_suggestions.get(day_of_week, "")
+        bullets = "\n".join(f"• {suggestion}" for suggestion in selected_suggestions)
 
         suggestion_text = f"""
 🤖 **Smart Suggestions for {day_of_week} {time_period.title()}:**
 
-• {selected_suggestions[0]}
-• {selected_suggestions[1]}
+{bullets}
 
 💡 **{day_of_week} Focus:**
 {day_suggestion}
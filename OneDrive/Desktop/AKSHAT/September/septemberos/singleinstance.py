@@ -0,0 +1,136 @@
+"""One SeptemberOS process per user and data directory.
+
+The first launch holds a lock file and listens on a local socket (a Unix
+domain socket, or a named pipe on Windows). A later launch connects, sends
+its request as one JSON line and exits, so only one process ever writes
+the data files. The check needs only QtCore and QtNetwork and runs before
+main.py imports the app, which keeps the second launch fast.
+"""
+import argparse
+import getpass
+import json
+import os
+import tempfile
+import time
+import zlib
+
+from PyQt5.QtCore import QObject, QLockFile, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+
+CONNECT_TIMEOUT_MS = 200
+# How long a launch that lost the lock race waits for the winner to listen
+STARTUP_WAIT_SECONDS = 10.0
+
+
+def instance_name(data_dir="."):
+    """Socket name shared by every launch on the same data files"""
+    data_dir = os.path.normcase(os.path.realpath(data_dir))
+    return f"septemberos-{getpass.getuser()}-{zlib.crc32(data_dir.encode('utf-8')):08x}"
+
+
+def parse_launch_request(argv):
+    """Request forwarded to the running instance; Qt's own options are ignored"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--note", help="open a LoFiBoard note by id or title")
+    parser.add_argument("--date", help="show a day (yyyy-MM-dd) in SepTempo")
+    args, _ = parser.parse_known_args(argv[1:])
+    return {key: value for key, value in vars(args).items() if value is not None}
+
+
+def send_request(name, request, timeout_ms=CONNECT_TIMEOUT_MS):
+    """Hand `request` to the instance listening on `name`; False if none answers"""
+    socket = QLocalSocket()
+    socket.connectToServer(name)
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write(json.dumps(request).encode("utf-8") + b"\n")
+    sent = socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    return sent
+
+
+def instance_running(name, timeout_ms=CONNECT_TIMEOUT_MS):
+    """Whether an instance listens on `name`; connects without sending anything"""
+    socket = QLocalSocket()
+    socket.connectToServer(name)
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.disconnectFromServer()
+    return True
+
+
+class InstanceServer(QObject):
+    """Receives the requests of later launches; lives for the whole session"""
+    request_received = pyqtSignal(dict)
+
+    def __init__(self, lock, data_dir="."):
+        super().__init__()
+        name = instance_name(data_dir)
+        self.lock = lock
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        # Holding the lock means any existing socket was left by a crashed instance
+        QLocalServer.removeServer(name)
+        if not self.server.listen(name):
+            raise OSError(f"Cannot listen on {name}: {self.server.errorString()}")
+        self.server.newConnection.connect(self.accept)
+
+    def accept(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            # Bound slots rather than lambdas, which PyQt dropped for some sockets
+            connection.readyRead.connect(self.on_ready_read)
+            connection.disconnected.connect(self.on_disconnected)
+            # A quick client may have sent everything and gone already
+            if connection.state() == QLocalSocket.UnconnectedState:
+                self.finish(connection)
+            else:
+                self.read_request(connection)
+
+    def on_ready_read(self):
+        self.read_request(self.sender())
+
+    def on_disconnected(self):
+        self.finish(self.sender())
+
+    def read_request(self, connection):
+        while connection.canReadLine():
+            try:
+                request = json.loads(bytes(connection.readLine()).decode("utf-8"))
+            except ValueError:
+                continue
+            if isinstance(request, dict):
+                self.request_received.emit(request)
+
+    def finish(self, connection):
+        # Whatever arrived together with the disconnect is still buffered
+        self.read_request(connection)
+        connection.deleteLater()
+
+    def close(self):
+        self.server.close()
+        self.lock.unlock()
+
+
+def claim_instance(request, data_dir="."):
+    """The held instance lock when this process should run the app, or None
+    after the request was handed to an instance that is already running.
+
+    Launches arriving before the owner of the lock listens keep retrying,
+    so the InstanceServer can be created once the QApplication exists.
+    """
+    name = instance_name(data_dir)
+    if send_request(name, request):
+        return None
+    lock = QLockFile(os.path.join(tempfile.gettempdir(), name + ".lock"))
+    # A lock left by a process that no longer exists is taken over
+    deadline = time.monotonic() + STARTUP_WAIT_SECONDS
+    while not lock.tryLock(0):
+        # Another launch won the race; give it time to start listening
+        if send_request(name, request):
+            return None
+        if time.monotonic() > deadline:
+            raise OSError(f"SeptemberOS is starting but not answering on {name}")
+        time.sleep(0.05)
+    return lock
@@ -4,7 +4,21 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushBut
                              QProgressBar, QTextEdit, QSpinBox, QGroupBox, QGridLayout)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
+import math
 import time
+from datetime import datetime, timedelta
+from .planner import plan_study_tasks, parse_task_line, busy_from_events
+from .eventstore import EventStore
+from .intervals import find_free_slot
+from .checkpoint import TimerCheckpoint
+from .persistence import save_json
+from .tracing import traced
+
+
+# Hours of the day the study planner is allowed to use
+PLAN_DAY_START_HOUR = 9
+PLAN_DAY_END_HOUR = 22
+PLAN_DAYS = 7
 
 
 class StudyNest(QWidget):
@@ -12,9 +26,11 @@ class StudyNest(QWidget):
         super().__init__()
         self.settings_file = "timer_settings.json"
         self.study_plans_file = "study_plans.json"
+        self.checkpoint = TimerCheckpoint("timer_checkpoint.bin")
         self.load_settings()
         self.setup_timer_state()
         self.setup_ui()
+        self.restore_checkpoint()
 
     def setup_timer_state(self):
         self.timer = QTimer()
@@ -23,6 +39,33 @@ class StudyNest(QWidget):
         self.current_phase = "work"  # work, short_break, long_break
         self.session_count = 0
         self.time_left = self.work_duration * 60  # Convert to seconds
+        self.deadline = 0.0  # Absolute wall-clock end of the running phase
+
+    def save_checkpoint(self):
+        self.checkpoint.save(self.current_phase, self.is_running, self.session_count,
+                             self.time_left, self.deadline if self.is_running else 0.0)
+
+    def restore_checkpoint(self):
+        state = self.checkpoint.load()
+        if not state:
+            return
+
+        self.current_phase = state["phase"]
+        self.session_count = state["session_count"]
+        self.time_left = state["time_left"] or self.get_current_phase_duration() * 60
+        self.sessions_label.setText(f"🍅 Sessions: {self.session_count}")
+
+        if state["running"]:
+            remaining = math.ceil(state["deadline"] - time.time())
+            if remaining > 0:
+                self.time_left = remaining
+                self.start_timer()
+                return
+            # The phase ended while the app was closed
+            self.complete_phase()
+            return
+
+        self.update_display()
 
     def load_settings(self):
         default_settings = {
@@ -47,8 +90,7 @@ class StudyNest(QWidget):
         self.sessions_until_long_break = self.settings["sessions_until_long_break"]
 
     def save_settings(self):
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        save_json(self.settings_file, self.settings, indent=2)
 
     def setup_ui(self):
         main_layout = QVBoxLayout()
@@ -188,6 +230,12 @@ class StudyNest(QWidget):
         ai_group = QGroupBox("🤖 AI Study Assistant")
         ai_layout = QVBoxLayout()
 
+        self.task_input = QTextEdit()
+        self.task_input.setMaximumHeight(80)
+        self.task_input.setPlaceholderText(
+            "One task per line: title | minutes | priority (1-5) | deadline (yyyy-mm-dd HH:MM)")
+        ai_layout.addWidget(self.task_input)
+
         generate_plan_btn = QPushButton("📚 Generate Study Plan")
         generate_plan_btn.clicked.connect(self.generate_study_plan)
         generate_plan_btn.setStyleSheet("""
@@ -205,6 +253,10 @@ class StudyNest(QWidget):
         """)
         ai_layout.addWidget(generate_plan_btn)
 
+        free_slot_btn = QPushButton("🕒 Find Next Free Session")
+        free_slot_btn.clicked.connect(self.find_next_free_session)
+        ai_layout.addWidget(free_slot_btn)
+
         self.study_plan_display = QTextEdit()
         self.study_plan_display.setMaximumHeight(150)
         self.study_plan_display.setPlaceholderText(
@@ -229,16 +281,21 @@ class StudyNest(QWidget):
 
     def start_timer(self):
         self.is_running = True
+        self.deadline = time.time() + self.time_left
         self.timer.start(1000)  # Update every second
         self.start_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
         self.apply_ambient_transition("start")
+        self.save_checkpoint()
+        self.update_display()
 
     def pause_timer(self):
         self.is_running = False
         self.timer.stop()
+        self.time_left = max(0, math.ceil(self.deadline - time.time()))
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
+        self.save_checkpoint()
 
     def reset_timer(self):
         self.timer.stop()
@@ -246,6 +303,7 @@ class StudyNest(QWidget):
         self.time_left = self.get_current_phase_duration() * 60
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
+        self.save_checkpoint()
         self.update_display()
 
     def skip_phase(self):
@@ -254,7 +312,8 @@ class StudyNest(QWidget):
         self.complete_phase()
 
     def update_timer(self):
-        self.time_left -= 1
+        # Derive from the deadline so missed ticks never make the timer drift
+        self.time_left = max(0, math.ceil(self.deadline - time.time()))
 
         if self.time_left <= 0:
             self.complete_phase()
@@ -281,6 +340,7 @@ class StudyNest(QWidget):
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.apply_ambient_transition("complete")
+        self.save_checkpoint()
         self.update_display()
 
     def get_current_phase_duration(self):
@@ -351,20 +411,76 @@ class StudyNest(QWidget):
         # Reset timer if not running
         if not self.is_running:
             self.time_left = self.get_current_phase_duration() * 60
+            self.save_checkpoint()
             self.update_display()
 
+    def load_calendar_events(self, start, days):
+        store = EventStore()
+        try:
+            return store.occurrences_between(start.strftime("%Y-%m-%d"),
+                                        (start + timedelta(days=days - 1)).strftime("%Y-%m-%d"))
+        finally:
+            store.close()
+
+    def get_planning_windows(self, now):
+        windows = []
+        for offset in range(PLAN_DAYS):
+            day = (now + timedelta(days=offset)).replace(second=0, microsecond=0)
+            start = day.replace(hour=PLAN_DAY_START_HOUR, minute=0)
+            end = day.replace(hour=PLAN_DAY_END_HOUR, minute=0)
+            if offset == 0:
+                start = max(start, day)
+            if start < end:
+                windows.append((start, end))
+        return windows
+
+    def find_next_free_session(self):
+        now = datetime.now()
+        store = EventStore()
+        try:
+            for start, end in self.get_planning_windows(now):
+                date_key = start.strftime("%Y-%m-%d")
+                slot = find_free_slot(store.interval_tree(date_key, date_key),
+                                      start, end, self.work_duration)
+                if slot:
+                    self.study_plan_display.setText(
+                        f"🕒 Next free {self.work_duration}-minute session: "
+                        f"{slot[0].strftime('%A %H:%M')}–{slot[1].strftime('%H:%M')}")
+                    return
+        finally:
+            store.close()
+        self.study_plan_display.setText("😔 No free session left this week")
+
+    @traced()
     def generate_study_plan(self):
-        # AI study plan simulation (replace with actual AI service)
-        study_plans = [
-            "🎯 **Focus Session Plan**:\n• 25 min: Deep work on primary task\n• 5 min: Stretch and hydrate\n• 25 min: Review and refine\n• Take notes on key insights 📝",
-
-            "📚 **Learning Sprint**:\n• 25 min: Read new material\n• 5 min: Quick mental review\n• 25 min: Practice or apply concepts\n• Write summary in your own words ✍️",
-
-            "🔄 **Review & Practice**:\n• 25 min: Review previous notes\n• 5 min: Quick break with fresh air\n• 25 min: Practice problems/exercises\n• Identify areas needing more work 🎯",
-
-            "🌟 **Creative Session**:\n• 25 min: Brainstorm and ideate\n• 5 min: Step away and reflect\n• 25 min: Organize and develop ideas\n• Document your best insights 💡"
-        ]
-
-        import random
-        selected_plan = random.choice(study_plans)
-        self.study_plan_display.setText(selected_plan)
+        now = datetime.now()
+        tasks = [task for task in (parse_task_line(line, now)
+                                   for line in self.task_input.toPlainText().splitlines())
+                 if task]
+        if not tasks:
+            self.study_plan_display.setText(
+                "📝 Add a few tasks above (one per line) and I'll fit them into "
+                "Pomodoro sessions around your SepTempo events.")
+            return
+
+        busy = busy_from_events(self.load_calendar_events(now.date(), PLAN_DAYS))
+        plan = plan_study_tasks(tasks, self.get_planning_windows(now), busy,
+                                self.work_duration, self.short_break_duration,
+                                self.long_break_duration, self.sessions_until_long_break)
+
+        lines = ["🎯 **Your Study Plan**:"]
+        current_day = None
+        for session in plan["sessions"]:
+            day = session["start"].date()
+            if day != current_day:
+                current_day = day
+                lines.append(f"\n📅 {session['start'].strftime('%A, %B %d')}")
+            lines.append(f"• {session['start'].strftime('%H:%M')}–{session['end'].strftime('%H:%M')}: "
+                         f"🍅 {session['task']['title']}")
+
+        if plan["unscheduled"]:
+            lines.append("\n⚠️ **Couldn't fit before the deadline**:")
+            for task in plan["unscheduled"]:
+                lines.append(f"• {task['title']}")
+
+        self.study_plan_display.setText("\n".join(lines))
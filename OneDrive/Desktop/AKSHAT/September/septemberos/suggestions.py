@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# How many hours ahead to look for usual activities, and how often a title
+# must have happened on a weekday before it counts as a habit
+LOOKAHEAD_HOURS = 3
+HABIT_MIN_COUNT = 3
+
+
+def mine_suggestions(store, now, limit=4):
+    """Suggestions drawn from the user's own history in the event store.
+
+    Both sources are frequency tables the store keeps current on every insert,
+    so the cost is bounded by categories x hour slots, not by history size.
+    """
+    suggestions = []
+    weekday = now.weekday()
+    day_name = WEEKDAY_NAMES[weekday]
+
+    # Categories the user usually has at this time of day on this weekday
+    seen = set()
+    for category, hour, count in store.category_slot_counts(
+            weekday, now.hour, min(23, now.hour + LOOKAHEAD_HOURS)):
+        if category in seen or count < 2:
+            continue
+        seen.add(category)
+        suggestions.append(
+            f"{category} is usual for you around {hour:02d}:00 on {day_name}s ({count}×)")
+        if len(suggestions) >= limit // 2:
+            break
+
+    # Weekly habits that have not been scheduled yet this week
+    week_start = (now - timedelta(days=weekday)).date()
+    week_end = week_start + timedelta(days=6)
+    scheduled = {event["title"] for event in store.occurrences_between(
+        week_start.isoformat(), week_end.isoformat())}
+    for title, habit_weekday, count, last_date in store.habitual_titles(HABIT_MIN_COUNT):
+        if len(suggestions) >= limit:
+            break
+        if habit_weekday < weekday or title in scheduled:
+            continue
+        when = "today" if habit_weekday == weekday else f"on {WEEKDAY_NAMES[habit_weekday]}"
+        suggestions.append(
+            f"🔁 \"{title}\" usually happens {when} ({count}×) but isn't scheduled this week")
+        scheduled.add(title)
+
+    return suggestions
@@ -238,6 +238,9 @@ def apply_september_theme(window):
         window.wave.show()
         window.wave.lower()
 
+        if not getattr(window, 'animations_active', True):
+            set_theme_animations_active(window, False)
+
     # Delay animation start to ensure window is fully initialized
     QTimer.singleShot(1000, add_animations)
 
@@ -259,3 +262,15 @@ def apply_september_theme(window):
         original_resize(event)
         on_resize()
     window.resizeEvent = new_resize_event
+
+
+def set_theme_animations_active(window, active):
+    """Pause or resume the background overlays, e.g. while the window is minimized"""
+    window.animations_active = active
+    for name in ('falling_leaves', 'particles', 'wave'):
+        overlay = getattr(window, name, None)
+        if overlay is not None:
+            if active:
+                overlay.resume()
+            else:
+                overlay.suspend()
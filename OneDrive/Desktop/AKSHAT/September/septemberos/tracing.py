@@ -0,0 +1,115 @@
+"""Lightweight spans for hot paths, exported as Chrome trace-event JSON.
+
+Tracing is enabled by setting SEPTEMBEROS_TRACE to the output path, e.g.
+SEPTEMBEROS_TRACE=trace.json. The trace is written at exit and on demand
+with Ctrl+Shift+T; open it in chrome://tracing or https://ui.perfetto.dev.
+When the variable is unset `traced` returns functions unchanged and `span`
+hands back one shared no-op context manager, so instrumented code pays
+nothing.
+"""
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+
+
+TRACE_PATH = os.environ.get("SEPTEMBEROS_TRACE")
+ENABLED = bool(TRACE_PATH)
+BUFFER_SIZE = 65536
+
+
+class SpanBuffer:
+    """Fixed-size ring of completed spans; the oldest are overwritten.
+
+    Writers never take a lock: next() on an itertools.count is atomic under
+    the GIL, so every span gets its own slot even across threads.
+    """
+
+    def __init__(self, size=BUFFER_SIZE):
+        self.size = size
+        self.slots = [None] * size
+        self.counter = itertools.count()
+
+    def add(self, name, start_ns, end_ns):
+        self.slots[next(self.counter) % self.size] = (name, start_ns, end_ns,
+                                                      threading.get_ident())
+
+    def spans(self):
+        return sorted((span for span in self.slots if span is not None), key=lambda s: s[1])
+
+
+buffer = SpanBuffer()
+
+
+class Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        buffer.add(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NO_SPAN = _NoSpan()
+
+
+def span(name):
+    """`with span("name"):` records the block when tracing is enabled"""
+    return Span(name) if ENABLED else NO_SPAN
+
+
+def traced(name=None):
+    """Decorator recording each call as a span named after the function"""
+    def decorate(function):
+        if not ENABLED:
+            return function
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                buffer.add(label, start, time.perf_counter_ns())
+        return wrapper
+    return decorate
+
+
+def export_chrome_trace(path=None):
+    """Write the buffered spans as Chrome trace-event JSON; returns the path"""
+    path = path or TRACE_PATH or "trace.json"
+    pid = os.getpid()
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": ident,
+               "args": {"name": thread_name}}
+              for ident, thread_name in thread_names.items()]
+    for name, start_ns, end_ns, ident in buffer.spans():
+        events.append({"name": name, "ph": "X", "pid": pid, "tid": ident,
+                       "ts": start_ns / 1000, "dur": (end_ns - start_ns) / 1000})
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+if ENABLED:
+    atexit.register(export_chrome_trace)
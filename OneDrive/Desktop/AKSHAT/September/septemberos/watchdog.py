@@ -0,0 +1,123 @@
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from logging.handlers import RotatingFileHandler
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Heartbeat(QObject):
+    """Lives on the GUI thread; answers pings posted from the watchdog thread"""
+    ping = pyqtSignal()
+
+    def __init__(self, answered):
+        super().__init__()
+        self.answered = answered
+        # Emitted from another thread, so Qt queues the call on the event loop
+        self.ping.connect(answered.set)
+
+
+class StallWatchdog:
+    """Reports when the Qt main thread stops processing events.
+
+    A background thread posts a ping to the event loop every `interval`
+    seconds. When it is not answered within `threshold`, the main thread's
+    Python stack is sampled via sys._current_frames() until the loop
+    responds again. The stall and the sampled stacks then go to a rotating
+    log. While the app is healthy the cost is a single queued call per
+    interval.
+    """
+
+    def __init__(self, log_path="stalls.log", threshold=0.25, interval=0.5,
+                 sample_interval=0.05, max_bytes=1_000_000, backup_count=3):
+        self.threshold = threshold
+        self.interval = interval
+        self.sample_interval = sample_interval
+        self.main_thread_id = threading.main_thread().ident
+        self.answered = threading.Event()
+        self.heartbeat = Heartbeat(self.answered)
+        self.stopped = threading.Event()
+        self.thread = None
+
+        self.stall_count = 0
+        self.stall_seconds = 0.0
+        self.call_sites = Counter()  # "file:line in function" -> seconds blocked there
+
+        self.logger = logging.getLogger("septemberos.stalls")
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            handler = RotatingFileHandler(log_path, maxBytes=max_bytes,
+                                          backupCount=backup_count, delay=True,
+                                          encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.answered.set()
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            self.answered.clear()
+            sent = time.monotonic()
+            self.heartbeat.ping.emit()
+            if self.answered.wait(self.threshold):
+                continue
+
+            samples = Counter()
+            while not self.answered.wait(self.sample_interval):
+                stack = self.sample_main_stack()
+                if stack:
+                    samples[stack] += 1
+            if not self.stopped.is_set():
+                self.record_stall(time.monotonic() - sent, samples)
+
+    def sample_main_stack(self):
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return None
+        return tuple((entry.filename, entry.lineno, entry.name)
+                     for entry in traceback.extract_stack(frame))
+
+    def record_stall(self, duration, samples):
+        self.stall_count += 1
+        self.stall_seconds += duration
+        total = sum(samples.values())
+        for stack, count in samples.items():
+            self.call_sites[blocking_call_site(stack)] += duration * count / total
+
+        lines = [f"Main thread blocked for at least {duration * 1000:.0f} ms ({total} samples)"]
+        if samples:
+            stack, count = samples.most_common(1)[0]
+            lines.append(f"Most frequent stack ({count}/{total} samples):")
+            lines.extend(f'  File "{filename}", line {lineno}, in {name}'
+                         for filename, lineno, name in stack)
+        lines.append("Top blocking call sites so far:")
+        lines.extend(f"  {seconds * 1000:8.0f} ms  {site}"
+                     for site, seconds in self.top_call_sites())
+        self.logger.warning("\n".join(lines))
+
+    def top_call_sites(self, limit=5):
+        return self.call_sites.most_common(limit)
+
+
+def blocking_call_site(stack):
+    """Innermost frame from this package, or the innermost frame overall"""
+    for filename, lineno, name in reversed(stack):
+        if os.path.abspath(filename).startswith(PACKAGE_DIR):
+            return f"{os.path.relpath(filename, os.path.dirname(PACKAGE_DIR))}:{lineno} in {name}"
+    filename, lineno, name = stack[-1]
+    return f"{filename}:{lineno} in {name}"
@@ -0,0 +1,113 @@
+from septemberos.eventstore import EventStore
+from septemberos.ics import export_ics, fold_line, import_ics, unfold_lines
+from septemberos.recurrence import RecurrenceRule
+
+
+def open_store(path):
+    return EventStore(str(path), legacy_json=None)
+
+
+def test_fold_line_round_trip():
+    line = "SUMMARY:" + "Überprüfung der Jahresplanung — " * 6
+    folded = fold_line(line)
+    raw_lines = [part.encode("utf-8") + b"\r\n" for part in folded.split("\r\n")[:-1]]
+    assert len(raw_lines) > 1
+    assert all(len(raw.rstrip(b"\r\n")) <= 75 for raw in raw_lines)
+    assert list(unfold_lines(raw_lines)) == [line]
+
+
+def test_import_joins_folded_lines(tmp_path):
+    path = tmp_path / "folded.ics"
+    path.write_bytes(
+        b"BEGIN:VCALENDAR\r\n"
+        b"BEGIN:VEVENT\r\n"
+        b"DTSTART:20250915T093000\r\n"
+        b"DTEND:20250915T110000\r\n"
+        b"SUMMARY:Quarterly review of the\r\n"
+        b"  study plan\r\n"
+        b"DESCRIPTION:Line one\\nline\r\n"
+        b"\t two\r\n"
+        b"END:VEVENT\r\n"
+        b"END:VCALENDAR\r\n")
+    store = open_store(tmp_path / "events.db")
+    try:
+        assert import_ics(store, str(path)) == 1
+        [event] = store.events_on("2025-09-15")
+    finally:
+        store.close()
+    assert event["title"] == "Quarterly review of the study plan"
+    assert event["description"] == "Line one\nline two"
+    assert event["time"] == "09:30"
+    assert event["duration"] == 90
+
+
+def test_rrule_round_trip(tmp_path):
+    rule = RecurrenceRule("2025-09-01", "weekly", 2, [0, 3], None, 6, ["2025-09-15"])
+    source = open_store(tmp_path / "source.db")
+    try:
+        source.add_series({"title": "Lab, part 2", "time": "14:00", "duration": 45,
+                           "category": "📚 Study"}, rule)
+        assert export_ics(source, str(tmp_path / "calendar.ics")) == 1
+    finally:
+        source.close()
+    assert not (tmp_path / "calendar.ics.tmp").exists()
+
+    target = open_store(tmp_path / "target.db")
+    try:
+        assert import_ics(target, str(tmp_path / "calendar.ics")) == 1
+        [(row, imported)] = list(target.iter_series())
+    finally:
+        target.close()
+    assert imported.to_dict() == rule.to_dict()
+    assert (row["title"], row["time"], row["duration"], row["category"]) == (
+        "Lab, part 2", "14:00", 45, "📚 Study")
+    assert list(imported.occurrences("2025-09-01", "2025-12-31")) == list(
+        rule.occurrences("2025-09-01", "2025-12-31"))
+
+
+def test_bounded_rrule_round_trip(tmp_path):
+    rule = RecurrenceRule("2025-09-03", "monthly", until="2025-12-03", exdates=["2025-11-03"])
+    source = open_store(tmp_path / "source.db")
+    try:
+        source.add_series({"title": "Rent", "time": "08:15"}, rule)
+        export_ics(source, str(tmp_path / "calendar.ics"))
+    finally:
+        source.close()
+    text = (tmp_path / "calendar.ics").read_bytes().decode("utf-8")
+    assert "DTSTART:20250903T081500\r\n" in text
+    assert "RRULE:FREQ=MONTHLY;UNTIL=20251203T235959\r\n" in text
+
+    target = open_store(tmp_path / "target.db")
+    try:
+        import_ics(target, str(tmp_path / "calendar.ics"))
+        [(_, imported)] = list(target.iter_series())
+    finally:
+        target.close()
+    assert imported.to_dict() == rule.to_dict()
+    assert [d.isoformat() for d in imported.occurrences("2025-01-01", "2026-12-31")] == [
+        "2025-09-03", "2025-10-03", "2025-12-03"]
+
+
+def test_cancel_after_the_last_check_keeps_the_export(tmp_path):
+    store = open_store(tmp_path / "events.db")
+    try:
+        store.add_event("2025-09-01", {"title": "Exam", "time": "09:00"})
+        store.add_series({"title": "Gym", "time": "18:00"}, RecurrenceRule("2025-09-01", "weekly"))
+        count = export_ics(store, str(tmp_path / "calendar.ics"), should_cancel=lambda: True)
+    finally:
+        store.close()
+    assert count == 2
+    assert (tmp_path / "calendar.ics").exists()
+
+
+def test_cancelled_export_writes_nothing(tmp_path):
+    store = open_store(tmp_path / "events.db")
+    try:
+        store.import_batch([("2025-09-01", {"title": f"Event {n}", "time": "09:00"})
+                            for n in range(600)])
+        count = export_ics(store, str(tmp_path / "calendar.ics"), should_cancel=lambda: True)
+    finally:
+        store.close()
+    assert count == 0
+    assert not (tmp_path / "calendar.ics").exists()
+    assert not (tmp_path / "calendar.ics.tmp").exists()
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+from septemberos.importprofile import CHECK_SCRIPT, parse_importtime
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_app_import_defers_heavy_modules():
+    # A fresh interpreter, since this one may already have imported them
+    result = subprocess.run([sys.executable, "-c", CHECK_SCRIPT],
+                            cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == []
+
+
+def test_parse_importtime_nests_children_under_their_parent():
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     json.decoder",
+        "import time:        80 |        200 |   json",
+        "import time:        50 |        250 | septemberos.app",
+    ]
+    [app] = parse_importtime(lines)
+    assert (app.name, app.self_us, app.cumulative_us) == ("septemberos.app", 50, 250)
+    [json_node] = app.children
+    assert json_node.name == "json"
+    assert [child.name for child in json_node.children] == ["json.decoder"]
@@ -0,0 +1,57 @@
+import random
+from datetime import datetime, timedelta
+
+from septemberos.eventstore import EventStore
+from septemberos.intervals import IntervalTree, find_free_slot
+
+
+def busy(start, end):
+    return start, end, {"start": start, "end": end}
+
+
+def test_overlapping_matches_a_linear_scan():
+    rng = random.Random(7)
+    intervals = []
+    for index in range(300):
+        start = rng.randrange(0, 1000)
+        intervals.append((start, start + rng.randrange(1, 60), index))
+    tree = IntervalTree(intervals)
+    assert len(tree) == 300
+    for _ in range(200):
+        start = rng.randrange(0, 1100)
+        end = start + rng.randrange(1, 80)
+        expected = {payload for s, e, payload in intervals if s < end and e > start}
+        assert set(tree.overlapping(start, end)) == expected
+
+
+def test_touching_intervals_do_not_overlap():
+    tree = IntervalTree([(10, 20, "a")])
+    assert tree.overlapping(20, 30) == []
+    assert tree.overlapping(0, 10) == []
+    assert tree.overlapping(19, 21) == ["a"]
+
+
+def test_free_slot_across_midnight():
+    day = datetime(2025, 10, 20)
+    tree = IntervalTree([busy(day.replace(hour=22, minute=30), day + timedelta(hours=23)),
+                         busy(day + timedelta(hours=23, minutes=15), day + timedelta(hours=25))])
+    # 23:00-23:15 is too short, so the slot starts when the late event ends
+    assert find_free_slot(tree, day.replace(hour=22), day + timedelta(hours=27), 60) == (
+        day + timedelta(hours=25), day + timedelta(hours=26))
+    assert find_free_slot(tree, day.replace(hour=22), day + timedelta(hours=25, minutes=30), 60) is None
+
+
+def test_store_tree_includes_the_previous_night_after_a_write(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"), legacy_json=None)
+    try:
+        midnight = datetime(2025, 10, 21)
+        tree = store.interval_tree("2025-10-21", "2025-10-21")
+        assert find_free_slot(tree, midnight, midnight + timedelta(hours=3), 60) == (
+            midnight, midnight + timedelta(hours=1))
+        # Written on the 20th, so the cached tree for the 21st must be dropped
+        store.add_event("2025-10-20", {"title": "Late shift", "time": "23:30", "duration": 120})
+        tree = store.interval_tree("2025-10-21", "2025-10-21")
+        assert find_free_slot(tree, midnight, midnight + timedelta(hours=3), 60) == (
+            midnight + timedelta(hours=1, minutes=30), midnight + timedelta(hours=2, minutes=30))
+    finally:
+        store.close()
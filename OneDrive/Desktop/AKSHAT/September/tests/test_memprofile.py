@@ -0,0 +1,33 @@
+import sys
+import tracemalloc
+
+from septemberos import memprofile
+
+
+def test_attribute_reports_the_innermost_package_frame(tmp_path, monkeypatch):
+    (tmp_path / "outer_pkg_mod.py").write_text(
+        "import inner_pkg_mod\n"
+        "def run():\n"
+        "    return inner_pkg_mod.allocate()\n")
+    (tmp_path / "inner_pkg_mod.py").write_text(
+        "def allocate():\n"
+        "    return bytearray(1_200_000)\n")
+    monkeypatch.setattr(memprofile, "PACKAGE_DIR", str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import outer_pkg_mod
+
+    tracemalloc.start(10)
+    try:
+        data = outer_pkg_mod.run()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        sys.modules.pop("outer_pkg_mod", None)
+        sys.modules.pop("inner_pkg_mod", None)
+
+    modules, sites = memprofile.attribute(snapshot)
+    site, size = max(sites.items(), key=lambda item: item[1])
+    assert site == "septemberos.inner_pkg_mod:2"
+    assert size >= len(data)
+    assert modules["septemberos.inner_pkg_mod"] >= len(data)
+    assert "septemberos.outer_pkg_mod" not in modules
@@ -0,0 +1,19 @@
+import os
+
+from septemberos.persistence import SNAPSHOT_SUFFIX, flush_writes, load_json, save_json
+
+
+def test_save_leaves_no_stale_snapshot(tmp_path):
+    path = str(tmp_path / "mood_data.json")
+    save_json(path, {"2025-09-01": {"mood": "calm"}}, indent=2)
+    assert flush_writes(5)
+    assert load_json(path) == {"2025-09-01": {"mood": "calm"}}
+    assert flush_writes(5)
+    assert os.path.exists(path + SNAPSHOT_SUFFIX)
+
+    save_json(path, {"2025-09-02": {"mood": "tired"}}, indent=2)
+    assert flush_writes(5)
+    assert not os.path.exists(path + SNAPSHOT_SUFFIX)
+    assert load_json(path) == {"2025-09-02": {"mood": "tired"}}
+    assert flush_writes(5)
+    assert load_json(path) == {"2025-09-02": {"mood": "tired"}}
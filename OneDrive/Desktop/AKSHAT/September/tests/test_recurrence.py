@@ -0,0 +1,49 @@
+from datetime import date
+
+from septemberos.recurrence import OccurrenceCache, RecurrenceRule
+
+
+def test_monthly_on_the_31st_skips_shorter_months():
+    rule = RecurrenceRule("2025-01-31", "monthly")
+    assert list(rule.occurrences("2025-01-01", "2025-12-31")) == [
+        date(2025, 1, 31), date(2025, 3, 31), date(2025, 5, 31), date(2025, 7, 31),
+        date(2025, 8, 31), date(2025, 10, 31), date(2025, 12, 31)]
+
+
+def test_monthly_interval_window_starting_mid_series():
+    rule = RecurrenceRule("2024-01-31", "monthly", interval=2)
+    assert list(rule.occurrences("2025-02-01", "2025-08-31")) == [
+        date(2025, 3, 31), date(2025, 5, 31), date(2025, 7, 31)]
+
+
+def test_count_includes_excluded_dates():
+    rule = RecurrenceRule("2025-09-01", "daily", count=5, exdates=["2025-09-02", "2025-09-05"])
+    assert rule.last_date() == date(2025, 9, 5)
+    assert list(rule.occurrences("2025-08-01", "2025-12-31")) == [
+        date(2025, 9, 1), date(2025, 9, 3), date(2025, 9, 4)]
+
+
+def test_weekly_count_with_exdate_and_window():
+    # Mondays and Wednesdays; the 4th occurrence (2025-09-10) is excluded
+    rule = RecurrenceRule("2025-09-01", "weekly", weekdays=[0, 2], count=4,
+                          exdates=["2025-09-10"])
+    assert list(rule.occurrences("2025-09-03", "2025-09-30")) == [
+        date(2025, 9, 3), date(2025, 9, 8)]
+
+
+def test_to_dict_round_trip():
+    rule = RecurrenceRule("2025-09-01", "weekly", 2, [0, 4], "2025-12-31", None, ["2025-09-15"])
+    copy = RecurrenceRule.from_dict(rule.to_dict())
+    assert copy.to_dict() == rule.to_dict()
+    assert list(copy.occurrences("2025-09-01", "2025-10-31")) == list(
+        rule.occurrences("2025-09-01", "2025-10-31"))
+
+
+def test_occurrence_cache_evicts_least_recently_used():
+    rule = RecurrenceRule("2025-09-01", "daily")
+    cache = OccurrenceCache(max_entries=2)
+    cache.get(1, 0, rule, "2025-09-01", "2025-09-07")
+    cache.get(2, 0, rule, "2025-09-01", "2025-09-07")
+    cache.get(1, 0, rule, "2025-09-01", "2025-09-07")  # 1 is now the most recent
+    cache.get(3, 0, rule, "2025-09-01", "2025-09-07")
+    assert [key[0] for key in cache.entries] == [1, 3]
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from septemberos.eventstore import EventStore
+from septemberos.recurrence import RecurrenceRule
+from septemberos.reminders import ReminderQueue
+
+
+def test_skipped_occurrence_is_not_reminded_after_refill(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"), legacy_json=None)
+    try:
+        series_id = store.add_series({"title": "Standup", "time": "09:00", "remind_minutes": 10},
+                                     RecurrenceRule("2025-09-01", "daily"))
+        now = datetime(2025, 9, 1, 8, 0)
+        queue = ReminderQueue(store, now=now)
+        store.skip_occurrence(series_id, "2025-09-02")
+        queue.refill(now)
+
+        due = queue.pop_due(datetime(2025, 9, 3, 8, 55))
+    finally:
+        store.close()
+    assert [event["date"] for event in due] == ["2025-09-01", "2025-09-03"]
+
+
+def test_fired_reminders_are_not_repeated_by_a_refill(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"), legacy_json=None)
+    try:
+        store.add_event("2025-09-01", {"title": "Exam", "time": "09:00", "remind_minutes": 30})
+        queue = ReminderQueue(store, now=datetime(2025, 9, 1, 8, 0))
+        assert [event["title"] for event in queue.pop_due(datetime(2025, 9, 1, 8, 31))] == ["Exam"]
+        queue.refill(datetime(2025, 9, 1, 8, 32))
+        assert queue.pop_due(datetime(2025, 9, 1, 8, 40)) == []
+    finally:
+        store.close()